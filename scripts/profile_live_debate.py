@@ -0,0 +1,154 @@
+"""
+Profile the Streamlit live-debate render path against a simulated stream.
+
+The real LLM client is replaced by one that replays fixture text at a fixed
+token rate, and the app is driven headlessly through
+streamlit.testing.v1.AppTest, so the numbers reflect UI/orchestration cost
+rather than model latency. Debates are saved to a temporary directory.
+
+Usage (from the project root):
+
+    python scripts/profile_live_debate.py                 # cProfile summary
+    python scripts/profile_live_debate.py -o live.prof    # also dump stats
+    py-spy record -o flame.svg -- python scripts/profile_live_debate.py
+
+Attach the before/after output to perf-related changes.
+"""
+from __future__ import annotations
+
+import argparse
+import cProfile
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from council.llm.base_client import ChatMessage, LLMClient  # noqa: E402
+
+
+FIXTURE_TEXT = (
+    "The archival record is uneven across regions, so any claim about the "
+    "period has to be weighed against where the surviving sources come from. "
+    "Administrative documents survive better than oral traditions, which "
+    "skews what we think we know. Policy conclusions should therefore be "
+    "framed as ranges with explicit uncertainty rather than point estimates. "
+)
+
+
+class FixtureStreamClient(LLMClient):
+    """
+    LLMClient that streams FIXTURE_TEXT word by word at `tokens_per_sec`.
+    """
+
+    def __init__(self, *, tokens_per_sec: float, repeat: int) -> None:
+        self._delay = 1.0 / tokens_per_sec if tokens_per_sec > 0 else 0.0
+        self._tokens = (FIXTURE_TEXT * repeat).split(" ")
+
+    def complete(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> str:
+        return "".join(self.stream(messages, model_alias=model_alias, **overrides))
+
+    def stream(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> Iterator[str]:
+        for token in self._tokens:
+            if self._delay:
+                time.sleep(self._delay)
+            yield token + " "
+
+
+def profile_new_threads(profilers: List[cProfile.Profile]) -> None:
+    """
+    Start a cProfile profiler in every thread started from now on.
+
+    AppTest executes the script, and the app its stream workers, outside
+    the main thread, which a single cProfile.Profile would not see.
+    """
+
+    def start(frame, event, arg) -> None:
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+        profilers.append(profiler)
+        profiler.enable()
+
+    threading.setprofile(start)
+
+
+def run_app(num_rebuttal_rounds: int) -> float:
+    """
+    Drive one full debate through the app and return its wall-clock time.
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(
+        str(ROOT / "src" / "council" / "io" / "streamlit_app.py"),
+        default_timeout=600,
+    )
+    at.run()
+    at.text_area[0].input("Should land records be digitised before reform?")
+    at.slider[0].set_value(num_rebuttal_rounds)
+    at.run()
+    at.button[0].click()
+
+    started = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - started
+
+    if at.exception:
+        raise RuntimeError(f"App raised: {[e.value for e in at.exception]}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tokens-per-sec", type=float, default=200.0)
+    parser.add_argument("--repeat", type=int, default=3, help="fixture repeats per turn")
+    parser.add_argument("--rounds", type=int, default=1, help="rebuttal rounds")
+    parser.add_argument("--top", type=int, default=25, help="functions to list")
+    parser.add_argument("-o", "--output", type=Path, help="write pstats data here")
+    args = parser.parse_args()
+
+    import council.io.persistence as persistence
+    import council.llm.model_registry as model_registry
+
+    model_registry._LLM_CLIENT = FixtureStreamClient(
+        tokens_per_sec=args.tokens_per_sec,
+        repeat=args.repeat,
+    )
+    debates_dir = Path(tempfile.mkdtemp(prefix="council-profile-"))
+    persistence._debates_dir = lambda: debates_dir
+
+    profilers: List[cProfile.Profile] = []
+    profile_new_threads(profilers)
+    main_profiler = cProfile.Profile()
+    main_profiler.enable()
+    elapsed = run_app(args.rounds)
+    main_profiler.disable()
+    threading.setprofile(None)
+
+    print(f"Live debate finished in {elapsed:.2f}s")
+    stats = pstats.Stats(main_profiler, *profilers)
+    stats.sort_stats(pstats.SortKey.TIME)
+    stats.print_stats(args.top)
+    if args.output:
+        stats.dump_stats(args.output)
+        print(f"Profile written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
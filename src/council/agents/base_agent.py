@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import functools
+import itertools
 from abc import ABC
 from dataclasses import dataclass
-from typing import Iterable, Iterator, Optional, Any, List
+from typing import Dict, Iterable, Iterator, Optional, Any, List, Tuple, Type
 
+from council.config.prompts import get_role_system_prompt
+from council.config.settings import get_settings
 from council.llm.base_client import ChatMessage, LLMClient
+from council.utils.memo import get_response_cache, make_cache_key
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     """
     Static configuration for an agent.
@@ -22,6 +27,25 @@ class AgentConfig:
     model_alias: Optional[str] = None
 
 
+@functools.lru_cache(maxsize=32)
+def _make_agent_config(
+    name: str,
+    role_id: str,
+    model_alias: Optional[str],
+) -> AgentConfig:
+    """
+    Return a shared AgentConfig for the given fields.
+
+    AgentConfig is frozen, so agents built with the same name, role and
+    model alias can safely share one instance.
+    """
+    return AgentConfig(name=name, role_id=role_id, model_alias=model_alias)
+
+
+# (client, model alias, [(index, messages, cache key)]) awaiting one batch call.
+_PendingBatch = Tuple[LLMClient, Optional[str], List[Tuple[int, List[ChatMessage], Optional[str]]]]
+
+
 class BaseAgent(ABC):
     """
     Base class for all council agents.
@@ -49,6 +73,8 @@ class BaseAgent(ABC):
         self._config = config
         self._llm = llm_client
         self._system_prompt = system_prompt
+        # Built once and reused as the head of every conversation.
+        self._system_message = ChatMessage(role="system", content=system_prompt)
 
     # ---- Public identity properties ----------------------------------------
 
@@ -64,35 +90,45 @@ class BaseAgent(ABC):
     def model_alias(self) -> Optional[str]:
         return self._config.model_alias
 
+    @property
+    def llm_client(self) -> LLMClient:
+        return self._llm
+
     @property
     def system_prompt(self) -> str:
         return self._system_prompt
 
     # ---- Internal helper ----------------------------------------------------
 
+    def _is_own_system_message(self, message: ChatMessage) -> bool:
+        return message is self._system_message or (
+            message.role == "system" and message.content == self._system_prompt
+        )
+
     def _with_system_message(
         self,
         conversation: Iterable[ChatMessage],
-    ) -> List[ChatMessage]:
+    ) -> Iterable[ChatMessage]:
         """
         Ensure a system message with the agent's role prompt is the first
         message in the sequence.
 
         If there's already a system message with the same content at the front,
-        we avoid duplicating it.
+        we avoid duplicating it. Lists that already start with it are returned
+        unchanged; other iterables are chained lazily rather than copied.
         """
-        conv_list = list(conversation)
-        if (
-            conv_list
-            and conv_list[0].role == "system"
-            and conv_list[0].content == self._system_prompt
-        ):
-            return conv_list
+        if isinstance(conversation, list):
+            if conversation and self._is_own_system_message(conversation[0]):
+                return conversation
+            return [self._system_message, *conversation]
 
-        return [
-            ChatMessage(role="system", content=self._system_prompt),
-            *conv_list,
-        ]
+        iterator = iter(conversation)
+        first = next(iterator, None)
+        if first is None:
+            return [self._system_message]
+        if self._is_own_system_message(first):
+            return itertools.chain((first,), iterator)
+        return itertools.chain((self._system_message, first), iterator)
 
     # ---- Core interface: respond -------------------------------------------
 
@@ -110,16 +146,56 @@ class BaseAgent(ABC):
         - `model_alias` optionally overrides this agent's default model choice.
         - `overrides` can pass per-call parameters (temperature, etc.).
 
-        Returns the full assistant message content.
+        Returns the full assistant message content. If the response cache is
+        enabled in Settings, identical requests are served from the cache.
         """
         messages = self._with_system_message(conversation)
         alias = model_alias or self._config.model_alias
 
-        return self._llm.complete(
+        cache = get_response_cache()
+        if cache is None:
+            return self._llm.complete(
+                messages,
+                model_alias=alias,
+                **overrides,
+            )
+
+        # The key and the client both iterate the messages.
+        messages = list(messages)
+        key = make_cache_key(messages, alias, overrides)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        content = self._llm.complete(
             messages,
             model_alias=alias,
             **overrides,
         )
+        cache.set(key, content)
+        return content
+
+    def respond_batch(
+        self,
+        conversations: Iterable[Iterable[ChatMessage]],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides: Any,
+    ) -> List[str]:
+        """
+        Respond to several independent conversations in one client call.
+
+        Responses already in the response cache (if enabled) are not
+        requested again. Returns one response per conversation, in input
+        order.
+        """
+        conversations = list(conversations)
+        return BaseAgent.respond_batch_across(
+            [self] * len(conversations),
+            conversations,
+            model_alias=model_alias,
+            **overrides,
+        )
 
     def respond_stream(
         self,
@@ -131,7 +207,8 @@ class BaseAgent(ABC):
         """
         Streaming response.
 
-        Yields text chunks from the underlying LLM client.
+        Yields text chunks from the underlying LLM client (which may already
+        group provider deltas; see ModelConfig.stream_batch_chars).
         """
         messages = self._with_system_message(conversation)
         alias = model_alias or self._config.model_alias
@@ -140,4 +217,176 @@ class BaseAgent(ABC):
             messages,
             model_alias=alias,
             **overrides,
-        )
\ No newline at end of file
+        )
+
+    async def arespond(
+        self,
+        conversation: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides: Any,
+    ) -> str:
+        """
+        Async (non-streaming) response.
+
+        Same contract as `respond()`, but awaits the client's `acomplete()`
+        so several agents can wait on the LLM concurrently.
+        """
+        messages = list(self._with_system_message(conversation))
+        alias = model_alias or self._config.model_alias
+
+        cache = get_response_cache()
+        key = None
+        if cache is not None:
+            key = make_cache_key(messages, alias, overrides)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        content = await self._llm.acomplete(
+            messages,
+            model_alias=alias,
+            **overrides,
+        )
+        if cache is not None:
+            cache.set(key, content)
+        return content
+
+    # ---- Batches across agents ----------------------------------------------
+
+    @staticmethod
+    def _plan_batch(
+        agents: List["BaseAgent"],
+        conversations: List[Iterable[ChatMessage]],
+        model_alias: Optional[str],
+        overrides: Dict[str, Any],
+    ) -> Tuple[List[str], List[_PendingBatch]]:
+        """
+        Resolve (agent, conversation) pairs against the response cache.
+
+        Returns the responses with cache hits filled in (misses are left
+        empty), and the misses grouped by (client, model alias).
+        """
+        cache = get_response_cache()
+        results: List[str] = [""] * len(agents)
+        groups: Dict[Tuple[int, Optional[str]], _PendingBatch] = {}
+        for i, (agent, conversation) in enumerate(zip(agents, conversations)):
+            alias = model_alias or agent._config.model_alias
+            messages = list(agent._with_system_message(conversation))
+            key = None
+            if cache is not None:
+                key = make_cache_key(messages, alias, overrides)
+                cached = cache.get(key)
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            group = groups.setdefault((id(agent._llm), alias), (agent._llm, alias, []))
+            group[2].append((i, messages, key))
+        return results, list(groups.values())
+
+    @staticmethod
+    def _record_batch(
+        results: List[str],
+        pending: List[Tuple[int, List[ChatMessage], Optional[str]]],
+        contents: List[str],
+    ) -> None:
+        cache = get_response_cache()
+        for (i, _, key), content in zip(pending, contents):
+            results[i] = content
+            if cache is not None and key is not None:
+                cache.set(key, content)
+
+    @staticmethod
+    def respond_batch_across(
+        agents: List["BaseAgent"],
+        conversations: List[Iterable[ChatMessage]],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides: Any,
+    ) -> List[str]:
+        """
+        Get one response per (agent, conversation) pair using batched calls.
+
+        Responses in the response cache (if enabled) are served from it, as
+        in respond(). The rest are grouped by LLM client and model alias and
+        each group is sent to that client's complete_batch(), so a provider
+        with a native batch endpoint sees one request per model instead of
+        one per agent. At most Settings.max_concurrent_llm requests of a
+        group are in flight at once.
+
+        Returns the responses in input order.
+        """
+        max_concurrency = get_settings().max_concurrent_llm
+        results, groups = BaseAgent._plan_batch(
+            agents, conversations, model_alias, overrides
+        )
+        for llm, alias, pending in groups:
+            contents = llm.complete_batch(
+                [messages for _, messages, _ in pending],
+                model_alias=alias,
+                max_concurrency=max_concurrency,
+                **overrides,
+            )
+            BaseAgent._record_batch(results, pending, contents)
+        return results
+
+    @staticmethod
+    async def arespond_batch_across(
+        agents: List["BaseAgent"],
+        conversations: List[Iterable[ChatMessage]],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides: Any,
+    ) -> List[str]:
+        """
+        Async variant of respond_batch_across(), awaiting each client's
+        acomplete_batch() instead of blocking on a thread pool.
+        """
+        max_concurrency = get_settings().max_concurrent_llm
+        results, groups = BaseAgent._plan_batch(
+            agents, conversations, model_alias, overrides
+        )
+        for llm, alias, pending in groups:
+            contents = await llm.acomplete_batch(
+                [messages for _, messages, _ in pending],
+                model_alias=alias,
+                max_concurrency=max_concurrency,
+                **overrides,
+            )
+            BaseAgent._record_batch(results, pending, contents)
+        return results
+
+
+async def aclose_agent_clients(agents: Iterable[BaseAgent]) -> None:
+    """
+    Call aclose() once on each distinct LLM client used by `agents`,
+    releasing what they hold for the running event loop.
+    """
+    seen = set()
+    for agent in agents:
+        llm = agent.llm_client
+        if id(llm) not in seen:
+            seen.add(id(llm))
+            await llm.aclose()
+
+
+def make_role_agent(name: str, role_id: str) -> Type[BaseAgent]:
+    """
+    Build a BaseAgent subclass for a council role.
+
+    The role's system prompt is resolved once, when the class is created,
+    so instantiating an agent only has to build its AgentConfig.
+    """
+    system_prompt = get_role_system_prompt(role_id)
+
+    def __init__(
+        self: BaseAgent,
+        llm_client: LLMClient,
+        *,
+        model_alias: Optional[str] = None,
+    ) -> None:
+        config = _make_agent_config(name, role_id, model_alias)
+        BaseAgent.__init__(self, config, llm_client, system_prompt)
+
+    cls_name = "".join(part.title() for part in role_id.split("_")) + "Agent"
+    return type(cls_name, (BaseAgent,), {"__init__": __init__})
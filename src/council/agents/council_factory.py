@@ -1,26 +1,27 @@
 from __future__ import annotations
 
-from typing import Dict, List, Type
+import asyncio
+from typing import Dict, List, NoReturn, Tuple, Type
 
-from council.agents.base_agent import BaseAgent
-from council.agents.indian_historian import IndianHistorianAgent
-from council.agents.civilizational_historian import CivilizationalHistorianAgent
-from council.agents.religion_expert import ReligionExpertAgent
-from council.agents.anthropology_expert import AnthropologyExpertAgent
-from council.agents.policymaker_expert import PolicymakerExpertAgent
+from council.agents.base_agent import BaseAgent, make_role_agent
 
 from council.config.settings import get_settings
 from council.llm.base_client import LLMClient
 from council.llm.model_registry import get_llm_client
 
 
+# (display name, role_id) for every council role
+_ROLE_AGENT_SPECS: Tuple[Tuple[str, str], ...] = (
+    ("Indian Historian", "indian_historian"),
+    ("Civilizational Historian", "civilizational_historian"),
+    ("Religion Expert", "religion_expert"),
+    ("Anthropology Expert", "anthropology_expert"),
+    ("Policy Analyst / Policymaker", "policymaker_expert"),
+)
+
 # Map from role_id to concrete agent class
 _ROLE_TO_AGENT_CLS: Dict[str, Type[BaseAgent]] = {
-    "indian_historian": IndianHistorianAgent,
-    "civilizational_historian": CivilizationalHistorianAgent,
-    "religion_expert": ReligionExpertAgent,
-    "anthropology_expert": AnthropologyExpertAgent,
-    "policymaker_expert": PolicymakerExpertAgent,
+    role_id: make_role_agent(name, role_id) for name, role_id in _ROLE_AGENT_SPECS
 }
 
 # Optional: per-role default model aliases for diversity.
@@ -34,6 +35,8 @@ _ROLE_MODEL_DEFAULTS: Dict[str, str] = {
     "policymaker_expert": "gpt_oss_latest",
 }
 
+_KNOWN_ROLES_MSG = ", ".join(sorted(_ROLE_TO_AGENT_CLS))
+
 
 def _resolve_model_alias(role_id: str) -> str:
     """
@@ -49,6 +52,33 @@ def _resolve_model_alias(role_id: str) -> str:
     return alias
 
 
+def _agent_cls_for_role(role_id: str) -> Type[BaseAgent]:
+    """
+    Look up the concrete agent class for a role, raising ValueError if the
+    role is unknown.
+    """
+    return _ROLE_TO_AGENT_CLS.get(role_id) or _raise_unknown_role(role_id)
+
+
+def _raise_unknown_role(role_id: str) -> NoReturn:
+    raise ValueError(
+        f"No agent class registered for role_id '{role_id}'. "
+        f"Known roles: {_KNOWN_ROLES_MSG}"
+    )
+
+
+def index_by_role(council: List[BaseAgent]) -> Dict[str, BaseAgent]:
+    """
+    Map role_id -> agent for a council, for O(1) role lookups.
+
+    If a role appears more than once, the first agent in council order wins.
+    """
+    index: Dict[str, BaseAgent] = {}
+    for agent in council:
+        index.setdefault(agent.role_id, agent)
+    return index
+
+
 def create_council(
     *,
     llm_client: LLMClient | None = None,
@@ -58,7 +88,8 @@ def create_council(
     Build a list of agents representing the council.
 
     - If `roles` is None, use Settings.council_roles.
-    - If `llm_client` is None, use the shared client from model_registry.
+    - If `llm_client` is None, use the shared client from model_registry;
+      all agents then share its single HTTP connection pool.
 
     Returns a list of BaseAgent instances in the order of `roles`.
     """
@@ -69,15 +100,38 @@ def create_council(
     council: List[BaseAgent] = []
 
     for role_id in roles:
-        agent_cls = _ROLE_TO_AGENT_CLS.get(role_id)
-        if agent_cls is None:
-            raise ValueError(
-                f"No agent class registered for role_id '{role_id}'. "
-                f"Known roles: {', '.join(sorted(_ROLE_TO_AGENT_CLS.keys()))}"
-            )
-
+        agent_cls = _agent_cls_for_role(role_id)
         model_alias = _resolve_model_alias(role_id)
         agent = agent_cls(llm, model_alias=model_alias)
         council.append(agent)
 
-    return council
\ No newline at end of file
+    return council
+
+
+async def create_council_async(
+    *,
+    llm_client: LLMClient | None = None,
+    roles: List[str] | None = None,
+) -> List[BaseAgent]:
+    """
+    Async variant of create_council().
+
+    Client construction and per-role model resolution may block (network or
+    filesystem in some backends), so they run in worker threads and the
+    per-role resolutions run concurrently.
+
+    Returns a list of BaseAgent instances in the order of `roles`.
+    """
+    settings = get_settings()
+    llm = llm_client or await asyncio.to_thread(get_llm_client)
+    roles = roles or settings.council_roles
+
+    agent_classes = [_agent_cls_for_role(role_id) for role_id in roles]
+    model_aliases = await asyncio.gather(
+        *(asyncio.to_thread(_resolve_model_alias, role_id) for role_id in roles)
+    )
+
+    return [
+        agent_cls(llm, model_alias=model_alias)
+        for agent_cls, model_alias in zip(agent_classes, model_aliases)
+    ]
\ No newline at end of file
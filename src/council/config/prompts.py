@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, NoReturn, Tuple
 
 
 # ---- Base debate system prompt ---------------------------------------------
@@ -38,10 +38,13 @@ Style:
 
 # ---- Role-specific prompts --------------------------------------------------
 
-ROLE_SYSTEM_PROMPTS: Dict[str, str] = {
-    "indian_historian": f"""
-{BASE_DEBATE_SYSTEM_PROMPT}
-
+# Each role maps to (shared base prefix, role suffix). The base prefix is the
+# same string object for every role so the leading bytes of every agent's
+# system prompt are identical, which is what provider-side prefix caches key on.
+ROLE_SYSTEM_PROMPTS: Dict[str, Tuple[str, str]] = {
+    "indian_historian": (
+        BASE_DEBATE_SYSTEM_PROMPT,
+        """
 Your role: INDIAN HISTORIAN
 
 - You specialize in the political, social, and economic history of the Indian
@@ -53,10 +56,11 @@ Your role: INDIAN HISTORIAN
   - ask "what period, what region, which sources?" and
   - distinguish between evidence, later interpretations, and myths.
 """.strip(),
+    ),
 
-    "civilizational_historian": f"""
-{BASE_DEBATE_SYSTEM_PROMPT}
-
+    "civilizational_historian": (
+        BASE_DEBATE_SYSTEM_PROMPT,
+        """
 Your role: CIVILIZATIONAL HISTORIAN
 
 - You analyze India as a civilization in interaction with other civilizations
@@ -68,10 +72,11 @@ Your role: CIVILIZATIONAL HISTORIAN
 - You highlight when arguments are presentist (projecting today's values onto
   older periods) and offer historically grounded alternatives.
 """.strip(),
+    ),
 
-    "religion_expert": f"""
-{BASE_DEBATE_SYSTEM_PROMPT}
-
+    "religion_expert": (
+        BASE_DEBATE_SYSTEM_PROMPT,
+        """
 Your role: RELIGION EXPERT
 
 - You focus on religious traditions relevant to India (e.g., Hindu traditions,
@@ -88,10 +93,11 @@ Your role: RELIGION EXPERT
   - historically documented,
   - or a modern ideological interpretation.
 """.strip(),
+    ),
 
-    "anthropology_expert": f"""
-{BASE_DEBATE_SYSTEM_PROMPT}
-
+    "anthropology_expert": (
+        BASE_DEBATE_SYSTEM_PROMPT,
+        """
 Your role: ANTHROPOLOGY EXPERT
 
 - You focus on social structures, caste, kinship, ethnicity, language, and
@@ -103,10 +109,11 @@ Your role: ANTHROPOLOGY EXPERT
 - When others make broad statements, you ask: "For whom, where, and in which
   social context is this true?"
 """.strip(),
+    ),
 
-    "policymaker_expert": f"""
-{BASE_DEBATE_SYSTEM_PROMPT}
-
+    "policymaker_expert": (
+        BASE_DEBATE_SYSTEM_PROMPT,
+        """
 Your role: POLICYMAKER / POLICY ANALYST
 
 - You focus on present-day and near-future policy implications for India.
@@ -121,26 +128,50 @@ Your role: POLICYMAKER / POLICY ANALYST
   and metrics for success.
 - You are candid about costs and trade-offs instead of offering feel-good answers.
 """.strip(),
+    ),
+}
+
+
+# Built once so lookups never have to sort role names.
+_KNOWN_ROLES_MSG = ", ".join(sorted(ROLE_SYSTEM_PROMPTS))
+
+# Full single-string prompts, joined once at import so the first
+# create_council() does not pay for it.
+_JOINED_ROLE_PROMPTS: Dict[str, str] = {
+    role: "\n\n".join(blocks) for role, blocks in ROLE_SYSTEM_PROMPTS.items()
 }
 
 
 # ---- Helper functions -------------------------------------------------------
 
 
-def get_role_system_prompt(role_name: str) -> str:
+def _raise_unknown_role(role_name: str) -> NoReturn:
+    raise KeyError(
+        f"Unknown council role '{role_name}'. Known roles: {_KNOWN_ROLES_MSG}"
+    )
+
+
+def get_role_system_prompt_blocks(role_name: str) -> Tuple[str, str]:
     """
-    Return the system prompt for a given council role.
+    Return the system prompt for a given council role as two blocks:
+    (shared base prefix, role-specific suffix).
+
+    Cache-aware clients can send these as separate content blocks so the
+    static prefix is reused across all roles.
 
     Raises KeyError if the role is unknown. The list of valid names is kept
     in Settings.council_roles and should match these keys.
     """
-    try:
-        return ROLE_SYSTEM_PROMPTS[role_name]
-    except KeyError as exc:
-        raise KeyError(
-            f"Unknown council role '{role_name}'. "
-            f"Known roles: {', '.join(sorted(ROLE_SYSTEM_PROMPTS.keys()))}"
-        ) from exc
+    return ROLE_SYSTEM_PROMPTS.get(role_name) or _raise_unknown_role(role_name)
+
+
+def get_role_system_prompt(role_name: str) -> str:
+    """
+    Return the system prompt for a given council role as a single string.
+
+    This is the base prefix and the role suffix joined by a blank line.
+    """
+    return _JOINED_ROLE_PROMPTS.get(role_name) or _raise_unknown_role(role_name)
 
 
 def get_base_debate_prompt() -> str:
@@ -3,13 +3,14 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
 # ---- Model configuration ----------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """
     Configuration for a single LLM model.
@@ -22,12 +23,17 @@ class ModelConfig:
     top_p: float = 1.0
     reasoning_effort: Optional[str] = None  # e.g. "medium"
     stream: bool = True
+    # Streamed deltas are grouped until at least this many characters (about
+    # two or three tokens) are pending, or stream_flush_ms has passed since
+    # the last yield; 1 yields every delta as the provider sends it.
+    stream_batch_chars: int = 12
+    stream_flush_ms: float = 50.0
 
 
 # ---- Application-wide settings ---------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """
     Application-wide configuration for the Council.
@@ -48,6 +54,15 @@ class Settings:
     # Optional: logging / debugging flags
     debug: bool = False
 
+    # --- Response cache (dev/test replay) ---
+    enable_response_cache: bool = False
+    response_cache_path: str = "~/.cache/council/responses.sqlite"
+
+    # --- Concurrency ---
+    # Upper bound on LLM requests in flight at once when agents are
+    # fanned out (e.g. opening statements), to respect provider limits.
+    max_concurrent_llm: int = 8
+
     @classmethod
     def from_env(cls) -> "Settings":
         """
@@ -56,12 +71,26 @@ class Settings:
         - OLLAMA_HOST         : optional (defaults to http://localhost:11434)
         - COUNCIL_DEBUG       : optional ("1"/"true" to enable)
         - COUNCIL_DEFAULT_MODEL_ALIAS : optional override for default model alias
+        - COUNCIL_RESPONSE_CACHE : optional ("1"/"true" to cache LLM responses)
+        - COUNCIL_RESPONSE_CACHE_PATH : optional SQLite file for the cache
+        - COUNCIL_MAX_CONCURRENT_LLM : optional cap on parallel LLM requests
         """
         ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 
         debug_env = os.getenv("COUNCIL_DEBUG", "").lower()
         debug = debug_env in {"1", "true", "yes", "on"}
 
+        cache_env = os.getenv("COUNCIL_RESPONSE_CACHE", "").lower()
+        enable_response_cache = cache_env in {"1", "true", "yes", "on"}
+        response_cache_path = os.path.expanduser(
+            os.getenv(
+                "COUNCIL_RESPONSE_CACHE_PATH",
+                "~/.cache/council/responses.sqlite",
+            )
+        )
+
+        max_concurrent_llm = max(1, int(os.getenv("COUNCIL_MAX_CONCURRENT_LLM", "8")))
+
         # You can add more models here later if you want.
         models: Dict[str, ModelConfig] = {
             # High-capacity, long outputs model:
@@ -94,16 +123,20 @@ class Settings:
             models=models,
             council_roles=council_roles,
             debug=debug,
+            enable_response_cache=enable_response_cache,
+            response_cache_path=response_cache_path,
+            max_concurrent_llm=max_concurrent_llm,
         )
 
 
 # ---- Lazy global accessor (DI-friendly) ------------------------------------
 
-# Internal singleton cache. We avoid constructing Settings at import time so
-# tests or tools can control the environment first.
-_SETTINGS: Optional[Settings] = None
+# Settings installed via override_settings(). We avoid constructing Settings
+# at import time so tests or tools can control the environment first.
+_SETTINGS_OVERRIDE: Optional[Settings] = None
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Access the global Settings instance.
@@ -111,16 +144,16 @@ def get_settings() -> Settings:
     Using a function instead of a module-level variable:
     - plays nicely with tests
     - avoids import-time failures if env is not ready
+
+    The instance is memoized, so repeated calls are a single cache hit.
     """
-    global _SETTINGS
-    if _SETTINGS is None:
-        _SETTINGS = Settings.from_env()
-    return _SETTINGS
+    return _SETTINGS_OVERRIDE or Settings.from_env()
 
 
 def override_settings(new_settings: Settings) -> None:
     """
     Allow tests or special environments to override settings at runtime.
     """
-    global _SETTINGS
-    _SETTINGS = new_settings
+    global _SETTINGS_OVERRIDE
+    _SETTINGS_OVERRIDE = new_settings
+    get_settings.cache_clear()
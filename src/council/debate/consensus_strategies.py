@@ -3,14 +3,82 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from council.agents.base_agent import BaseAgent
+from council.agents.council_factory import index_by_role
 from council.debate.debate_topic import DebateTopic
 from council.debate.message import DebateMessage, DebateStage
 from council.llm.base_client import ChatMessage
 
 
+_SEP = "\n" + "-" * 40 + "\n"
+
+
+# Everything in the consensus prompt that does not depend on the debate.
+CONSENSUS_STATIC_PREAMBLE = """
+You are now acting as the COUNCIL'S CONSENSUS DRAFTER.
+
+The next message gives the debate topic and the transcript of the council's
+debate, including opening statements and rebuttals. Your task:
+
+1. Extract the factual points that are well-supported or broadly accepted.
+2. Identify key disagreements and why the experts differ.
+3. Propose a best-effort, evidence-grounded conclusion that:
+   - does not simply average opinions,
+   - states where the evidence strongly points,
+   - is clear about remaining uncertainty.
+4. Translate implications into concrete, realistic considerations for
+   contemporary Indian policy or public discourse where relevant.
+5. Ensure all five expert perspectives are represented in proportion to the
+   strength and relevance of their evidence-backed arguments.
+
+Rules:
+- Be explicit about reasoning.
+- Critique ideas, institutions, and policies. As the debate aims to reach
+  objective truth, avoid political correctness or euphemisms; favor clear,
+  topic-anchored facts and trade-offs.
+- If an argument is off-topic or weakly supported, down-weight it explicitly;
+  if it is well-supported, highlight why and by whom it was offered.
+
+Write the COUNCIL CONSENSUS in the following structure:
+
+1. Core factual points
+2. Key disagreements
+3. Provisional conclusion
+4. Policy / practical implications (if any)
+""".strip()
+
+# Per-debate part of the consensus prompt; filled with str.format_map so the
+# template text is parsed once at import rather than rebuilt on every call.
+_CONSENSUS_CONTEXT_TEMPLATE = """
+Debate topic:
+{topic_title}
+
+Description:
+{topic_description}
+
+Constraints:
+{constraints}
+
+Transcript:
+{transcript_text}
+
+Now write the COUNCIL CONSENSUS using the structure above.
+""".strip()
+
+_DIGEST_TEMPLATE = """
+Condense each of the following council debate turns into ONE sentence that
+captures the speaker's main claim and the evidence behind it. Keep the turns
+in order and output exactly one bullet per turn, formatted as:
+
+- round=<round> speaker=<speaker>: <sentence>
+
+Turns:
+{turns}
+""".strip()
+
+
 @dataclass
 class ConsensusResult:
     """
@@ -33,6 +101,23 @@ class ConsensusStrategy(ABC):
     ) -> ConsensusResult:
         raise NotImplementedError
 
+    def generate_consensus_batch(
+        self,
+        topics: List[DebateTopic],
+        transcripts: List[List[DebateMessage]],
+        council: List[BaseAgent],
+    ) -> List[ConsensusResult]:
+        """
+        Generate consensus for several independent debates.
+
+        The default runs generate_consensus() once per topic; strategies can
+        override this to batch the underlying LLM calls.
+        """
+        return [
+            self.generate_consensus(topic, transcript, council)
+            for topic, transcript in zip(topics, transcripts)
+        ]
+
 
 class PolicyLeadConsensusStrategy(ConsensusStrategy):
     """
@@ -49,27 +134,202 @@ class PolicyLeadConsensusStrategy(ConsensusStrategy):
     The summarizer must weight each expert's contribution by evidentiary
     strength and relevance to the topic rather than by tone or perceived
     politeness.
+
+    If the formatted transcript is estimated to exceed
+    `max_transcript_tokens`, the turns before the final round are condensed
+    to one sentence each by a short secondary call to the summarizer, and
+    only the final round is passed in full. Set it to None to always send
+    the full transcript.
+
+    `role_index` (see council_factory.index_by_role) can be passed if the
+    caller already has one; it is used for a council only if every agent in
+    it belongs to that council. Otherwise an index is built from the council
+    on first use and reused while the same council list is passed in.
     """
 
+    def __init__(
+        self,
+        *,
+        max_transcript_tokens: Optional[int] = 2000,
+        digest_max_tokens: int = 512,
+        role_index: Optional[Dict[str, BaseAgent]] = None,
+    ) -> None:
+        self._max_transcript_tokens = max_transcript_tokens
+        self._digest_max_tokens = digest_max_tokens
+        self._role_index = role_index
+        self._role_index_source: Optional[List[BaseAgent]] = None
+
+        # Formatting cache for the most recently seen transcript list, so
+        # repeated calls only format messages appended since the last call.
+        self._formatted_source: Optional[List[DebateMessage]] = None
+        self._formatted_blocks: List[str] = []
+        self._formatted_chars = 0
+
+    def _role_index_for(self, council: List[BaseAgent]) -> Dict[str, BaseAgent]:
+        index = self._role_index
+        if index is not None and self._role_index_source is council:
+            return index
+
+        # A caller-supplied index has no recorded source yet; adopt it only
+        # if it was built from this council's agents.
+        if index is None or self._role_index_source is not None or not (
+            {id(agent) for agent in index.values()}
+            <= {id(agent) for agent in council}
+        ):
+            index = index_by_role(council)
+        self._role_index = index
+        self._role_index_source = council
+        return index
+
     def _select_summarizer(self, council: List[BaseAgent]) -> BaseAgent:
-        for agent in council:
-            if agent.role_id == "policymaker_expert":
-                return agent
-        return council[0]
+        return self._role_index_for(council).get("policymaker_expert") or council[0]
+
+    @staticmethod
+    def _estimate_tokens(num_chars: int) -> int:
+        """Rough token estimate (~4 characters per token)."""
+        return num_chars // 4
+
+    @staticmethod
+    def _format_message(msg: DebateMessage) -> str:
+        return (
+            f"round={msg.round_index} stage={msg.stage.value.upper()} "
+            f"speaker={msg.speaker_name}\n"
+            f"{msg.content.strip()}"
+        )
 
+    def _formatted_blocks_for(self, transcript: List[DebateMessage]) -> List[str]:
+        """
+        Return one formatted block per transcript message.
+
+        Transcripts are append-only, so when called again with the same list
+        only the newly appended messages are formatted. The total length of
+        the joined text is tracked alongside, in `_formatted_chars`.
+        """
+        if (
+            transcript is not self._formatted_source
+            or len(transcript) < len(self._formatted_blocks)
+        ):
+            self._formatted_source = transcript
+            self._formatted_blocks = []
+            self._formatted_chars = 0
+
+        blocks = self._formatted_blocks
+        for msg in transcript[len(blocks):]:
+            block = self._format_message(msg)
+            if blocks:
+                self._formatted_chars += len(_SEP)
+            self._formatted_chars += len(block)
+            blocks.append(block)
+        return blocks
+
     def _format_transcript(self, transcript: List[DebateMessage]) -> str:
         """
         Convert the full transcript into a readable text block.
+        """
+        return _SEP.join(self._formatted_blocks_for(transcript))
+
+    def _plan_transcript(
+        self,
+        transcript: List[DebateMessage],
+        council: List[BaseAgent],
+    ) -> Tuple[Optional[List[str]], str]:
+        """
+        Split the transcript to fit `max_transcript_tokens`.
 
-        With local models and relaxed token limits, we no longer truncate.
+        Returns the earlier (formatted) turns that need a digest, or None if
+        the transcript fits as is, and the text that is sent in full.
         """
-        lines: List[str] = []
-        for msg in transcript:
-            stage = msg.stage.value.upper()
-            lines.append(f"[{msg.round_index} | {stage} | {msg.speaker_name}]")
-            lines.append(msg.content.strip())
-            lines.append("-" * 40)
-        return "\n".join(lines)
+        blocks = self._formatted_blocks_for(transcript)
+
+        # Budget check on the tracked length, so an over-budget transcript
+        # is never joined in full.
+        if (
+            self._max_transcript_tokens is None
+            or self._estimate_tokens(self._formatted_chars)
+            <= self._max_transcript_tokens
+        ):
+            return None, self._format_transcript(transcript)
+
+        # The final round is one turn per council member.
+        final_round = blocks[-len(council):]
+        earlier = blocks[:-len(council)]
+        if not earlier:
+            return None, self._format_transcript(transcript)
+        return earlier, _SEP.join(final_round)
+
+    @staticmethod
+    def _digest_conversation(blocks: List[str]) -> List[ChatMessage]:
+        """
+        Build the request that condenses earlier (already formatted) turns
+        into one bullet per turn.
+        """
+        turns = _SEP.join(blocks)
+        instructions = _DIGEST_TEMPLATE.format_map({"turns": turns})
+        return [ChatMessage(role="user", content=instructions)]
+
+    @staticmethod
+    def _condensed_transcript(digest: str, final_text: str) -> str:
+        return (
+            "Earlier turns (condensed to one sentence each):\n"
+            f"{digest.strip()}{_SEP}"
+            "Final round (full text):\n"
+            f"{final_text}"
+        )
+
+    def _transcript_for_prompt(
+        self,
+        transcript: List[DebateMessage],
+        council: List[BaseAgent],
+        summarizer: BaseAgent,
+    ) -> Tuple[str, bool]:
+        """
+        Return the transcript text for the consensus prompt and whether it
+        was condensed, with a short, low-token digest call to the summarizer.
+        """
+        earlier, text = self._plan_transcript(transcript, council)
+        if earlier is None:
+            return text, False
+
+        digest = summarizer.respond(
+            self._digest_conversation(earlier),
+            max_completion_tokens=self._digest_max_tokens,
+        )
+        return self._condensed_transcript(digest, text), True
+
+    @staticmethod
+    def _build_conversation(
+        topic: DebateTopic,
+        transcript_text: str,
+    ) -> List[ChatMessage]:
+        """
+        Build the consensus request for one debate.
+        """
+        debate_context = _CONSENSUS_CONTEXT_TEMPLATE.format_map(
+            {
+                "topic_title": topic.title,
+                "topic_description": topic.description,
+                "constraints": topic.constraints or "None specified.",
+                "transcript_text": transcript_text,
+            }
+        )
+
+        # Static preamble first so the leading bytes are identical on every
+        # call (cacheable prefix); per-debate content follows.
+        return [
+            ChatMessage(role="user", content=CONSENSUS_STATIC_PREAMBLE),
+            ChatMessage(role="user", content=debate_context),
+        ]
+
+    @staticmethod
+    def _make_result(
+        summarizer: BaseAgent,
+        text: str,
+        condensed: bool,
+    ) -> ConsensusResult:
+        notes = f"summarizer={summarizer.role_id}"
+        if condensed:
+            notes += " transcript=condensed"
+        return ConsensusResult(text=text, notes=notes)
 
     def generate_consensus(
         self,
@@ -84,54 +344,67 @@ class PolicyLeadConsensusStrategy(ConsensusStrategy):
             )
 
         summarizer = self._select_summarizer(council)
-        transcript_text = self._format_transcript(transcript)
+        transcript_text, condensed = self._transcript_for_prompt(
+            transcript, council, summarizer
+        )
+        consensus_text = summarizer.respond(
+            self._build_conversation(topic, transcript_text)
+        )
 
-        instructions = f"""
-You are now acting as the COUNCIL'S CONSENSUS DRAFTER.
+        return self._make_result(summarizer, consensus_text, condensed)
 
-Debate topic:
-{topic.title}
-
-Description:
-{topic.description}
-
-Constraints:
-{topic.constraints or "None specified."}
-
-Below is the full transcript of the council's debate, including opening
-statements and rebuttals. Your task:
-
-1. Extract the factual points that are well-supported or broadly accepted.
-2. Identify key disagreements and why the experts differ.
-3. Propose a best-effort, evidence-grounded conclusion that:
-   - does not simply average opinions,
-   - states where the evidence strongly points,
-   - is clear about remaining uncertainty.
-4. Translate implications into concrete, realistic considerations for
-   contemporary Indian policy or public discourse where relevant.
-5. Ensure all five expert perspectives are represented in proportion to the
-   strength and relevance of their evidence-backed arguments.
-
-Rules:
-- Be explicit about reasoning.
-- Critique ideas, institutions, and policies. As the debate aims to reach
-  objective truth, avoid political correctness or euphemisms; favor clear,
-  topic-anchored facts and trade-offs.
-- If an argument is off-topic or weakly supported, down-weight it explicitly;
-  if it is well-supported, highlight why and by whom it was offered.
-
-Transcript:
-{transcript_text}
-
-Now write the COUNCIL CONSENSUS in the following structure:
+    def generate_consensus_batch(
+        self,
+        topics: List[DebateTopic],
+        transcripts: List[List[DebateMessage]],
+        council: List[BaseAgent],
+    ) -> List[ConsensusResult]:
+        """
+        Generate consensus for several debates with batched calls to the
+        summarizer's LLM client: one for the digests of every over-budget
+        transcript, then one for the consensus prompts.
+        """
+        if not council:
+            return [
+                ConsensusResult(
+                    text="No council agents were available to form a consensus.",
+                    notes="empty_council",
+                )
+                for _ in topics
+            ]
 
-1. Core factual points
-2. Key disagreements
-3. Provisional conclusion
-4. Policy / practical implications (if any)
-""".strip()
+        summarizer = self._select_summarizer(council)
+        plans = [
+            self._plan_transcript(transcript, council) for transcript in transcripts
+        ]
+        digest_requests = [
+            self._digest_conversation(earlier)
+            for earlier, _ in plans
+            if earlier is not None
+        ]
+        digests = iter(
+            summarizer.respond_batch(
+                digest_requests,
+                max_completion_tokens=self._digest_max_tokens,
+            )
+            if digest_requests
+            else []
+        )
 
-        conversation = [ChatMessage(role="user", content=instructions)]
-        consensus_text = summarizer.respond(conversation)
+        transcript_texts = [
+            text
+            if earlier is None
+            else self._condensed_transcript(next(digests), text)
+            for earlier, text in plans
+        ]
+        texts = summarizer.respond_batch(
+            [
+                self._build_conversation(topic, transcript_text)
+                for topic, transcript_text in zip(topics, transcript_texts)
+            ]
+        )
 
-        return ConsensusResult(text=consensus_text, notes=f"summarizer={summarizer.role_id}")
+        return [
+            self._make_result(summarizer, text, earlier is not None)
+            for text, (earlier, _) in zip(texts, plans)
+        ]
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from council.agents.base_agent import BaseAgent
 
@@ -14,8 +14,14 @@ class RoundConfig:
     Configuration parameters for the debate.
 
     - num_rebuttal_rounds: how many full council rebuttal cycles
+    - concurrent_rebuttals: request all rebuttals of a round at once; each
+      agent then sees only the turns from earlier rounds
+    - context_window: if set, rebuttal prompts include only this many of
+      the most recent turns, keeping prompt size constant in long debates
     """
     num_rebuttal_rounds: int = 1
+    concurrent_rebuttals: bool = False
+    context_window: Optional[int] = None
 
 
 class DebateProtocol(ABC):
@@ -40,6 +46,22 @@ class DebateProtocol(ABC):
         """How many rebuttal rounds to run."""
         raise NotImplementedError
 
+    def concurrent_rebuttals(self) -> bool:
+        """
+        Whether all rebuttals within a round may be requested concurrently.
+
+        Defaults to False: each rebuttal sees the ones before it.
+        """
+        return False
+
+    def context_window(self) -> Optional[int]:
+        """
+        Maximum number of prior turns shown in a rebuttal prompt.
+
+        Defaults to None: the whole transcript so far.
+        """
+        return None
+
 
 class BasicDebateProtocol(DebateProtocol):
     """
@@ -47,16 +69,25 @@ class BasicDebateProtocol(DebateProtocol):
 
     - Opening: each agent once, in council order
     - Rebuttal: each agent once per round, in council order
+
+    Both orders are the council list itself rather than a copy; callers
+    only iterate them and must not mutate them.
     """
 
     def __init__(self, config: RoundConfig | None = None) -> None:
         self._config = config or RoundConfig()
 
     def opening_order(self, council: List[BaseAgent]) -> List[BaseAgent]:
-        return list(council)
+        return council
 
     def rebuttal_order(self, council: List[BaseAgent]) -> List[BaseAgent]:
-        return list(council)
+        return council
 
     def num_rebuttal_rounds(self) -> int:
         return self._config.num_rebuttal_rounds
+
+    def concurrent_rebuttals(self) -> bool:
+        return self._config.concurrent_rebuttals
+
+    def context_window(self) -> Optional[int]:
+        return self._config.context_window
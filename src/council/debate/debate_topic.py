@@ -19,16 +19,23 @@ class DebateTopic:
     description: str
     constraints: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # The topic is immutable and its prompt is requested on every agent
+        # turn, so build it once. Not a dataclass field: eq/hash/repr ignore it.
+        constraints_block = (
+            f"\n\nConstraints / scope:\n{self.constraints}"
+            if self.constraints
+            else ""
+        )
+        object.__setattr__(
+            self,
+            "_user_prompt",
+            f"Debate topic: {self.title}\n\n"
+            f"Description:\n{self.description}{constraints_block}",
+        )
+
     def as_user_prompt(self) -> str:
         """
         Serialize the topic into a single user-message string for LLMs.
         """
-        parts = [
-            f"Debate topic: {self.title}",
-            "",
-            f"Description:\n{self.description}",
-        ]
-        if self.constraints:
-            parts.append("")
-            parts.append(f"Constraints / scope:\n{self.constraints}")
-        return "\n".join(parts)
\ No newline at end of file
+        return self._user_prompt
\ No newline at end of file
@@ -8,7 +8,7 @@ from council.debate.message import DebateMessage
 from council.debate.debate_topic import DebateTopic
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnEvaluation:
     """
     Evaluation of a single DebateMessage.
@@ -44,15 +44,13 @@ class NoOpEvaluator(DebateEvaluator):
         topic: DebateTopic,
         transcript: List[DebateMessage],
     ) -> List[TurnEvaluation]:
-        results: List[TurnEvaluation] = []
-        for idx, _msg in enumerate(transcript):
-            results.append(
-                TurnEvaluation(
-                    message_index=idx,
-                    logical_clarity=0.5,
-                    use_of_evidence=0.5,
-                    fairness_to_other_views=0.5,
-                    notes="No-op evaluator (placeholder).",
-                )
+        return [
+            TurnEvaluation(
+                message_index=idx,
+                logical_clarity=0.5,
+                use_of_evidence=0.5,
+                fairness_to_other_views=0.5,
+                notes="No-op evaluator (placeholder).",
             )
-        return results
\ No newline at end of file
+            for idx in range(len(transcript))
+        ]
\ No newline at end of file
@@ -14,11 +14,13 @@ class DebateStage(str, Enum):
 RoleType = Literal["user", "assistant", "system"]
 
 
-@dataclass
+@dataclass(slots=True)
 class DebateMessage:
     """
     A single message in the debate transcript.
 
+    Slotted: transcripts can hold many messages and none need extra attributes.
+
     - speaker_id: stable id for the source (e.g. "indian_historian", "user")
     - speaker_name: human-friendly label ("Indian Historian", "User")
     - role: chat role from the LLM perspective ("user"/"assistant"/"system")
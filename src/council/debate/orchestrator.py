@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import List, Optional
 
-from council.agents.base_agent import BaseAgent
+from council.agents.base_agent import BaseAgent, aclose_agent_clients
+from council.config.settings import get_settings
 from council.debate.debate_protocol import DebateProtocol
 from council.debate.debate_topic import DebateTopic
 from council.debate.message import DebateMessage, DebateStage
@@ -15,6 +17,17 @@ from council.debate.consensus_strategies import (
 from council.llm.base_client import ChatMessage
 
 
+# How much of each older turn is kept in a transcript digest.
+_DIGEST_PREVIEW_CHARS = 200
+
+
+def _digest_line(msg: DebateMessage) -> str:
+    preview = " ".join(msg.content.split())
+    if len(preview) > _DIGEST_PREVIEW_CHARS:
+        preview = preview[:_DIGEST_PREVIEW_CHARS].rstrip() + "..."
+    return f"- {msg.speaker_name} | {msg.stage.value} | #{msg.round_index} | {preview}"
+
+
 @dataclass
 class DebateTranscript:
     """
@@ -22,9 +35,60 @@ class DebateTranscript:
 
     - topic: the debated topic
     - messages: ordered list of DebateMessage
+    - chat_context: the messages already rendered as labelled ChatMessages
+      for rebuttal prompts; extended lazily, one entry per message
+    - digest_lines: one-line previews of messages, for recent_context();
+      extended lazily like chat_context
     """
     topic: DebateTopic
     messages: List[DebateMessage] = field(default_factory=list)
+    chat_context: List[ChatMessage] = field(
+        default_factory=list, repr=False, compare=False
+    )
+    digest_lines: List[str] = field(
+        default_factory=list, repr=False, compare=False
+    )
+
+    def context_messages(self) -> List[ChatMessage]:
+        """
+        Return the transcript as labelled assistant messages, rendering only
+        the messages added since the last call.
+
+        The returned list is the shared cache; callers must not mutate it.
+        """
+        context = self.chat_context
+        context.extend(
+            ChatMessage(
+                role="assistant",
+                content=(
+                    f"{msg.speaker_name} ({msg.stage.value}, #{msg.round_index}):"
+                    f"\n{msg.content}"
+                ),
+            )
+            for msg in self.messages[len(context):]
+        )
+        return context
+
+    def recent_context(self, recent: int) -> List[ChatMessage]:
+        """
+        Return the last `recent` messages as in context_messages(), preceded
+        by a single message digesting every earlier turn in one line each.
+
+        This keeps rebuttal prompts close to constant in size however long
+        the debate runs, while still telling the agent who said what.
+        """
+        context = self.context_messages()
+        older = len(context) - max(recent, 0)
+        if older <= 0:
+            return context
+
+        lines = self.digest_lines
+        lines.extend(_digest_line(msg) for msg in self.messages[len(lines):older])
+        digest = ChatMessage(
+            role="assistant",
+            content="Digest of earlier turns:\n" + "\n".join(lines[:older]),
+        )
+        return [digest, *context[older:]]
 
 
 @dataclass
@@ -39,6 +103,32 @@ class DebateResult:
     consensus: Optional[ConsensusResult]
 
 
+# Per-stage task text; only the agent's name varies, and it comes after the
+# shared topic block so the prompt prefix is identical across agents.
+_OPENING_INSTRUCTIONS = """\
+You are {name} participating in the opening round of the council debate.
+
+Task:
+- Present your analysis of the topic from your expertise.
+- Anticipate possible objections from other specialists.
+- Be explicit about sources, periods, and uncertainties.
+- You are NOT trying to be "balanced" for its own sake; you are trying
+  to be accurate, rigorous, and honest about trade-offs.
+- Keep every point tightly linked to the stated topic; avoid tangents or
+  virtue-signaling and let evidence drive your stance."""
+
+_REBUTTAL_INSTRUCTIONS = """\
+You are {name} participating in a rebuttal round of the council debate.
+
+Task:
+- Engage with previous statements from the other experts.
+- Point out where you agree and where you disagree, and WHY.
+- Bring in additional evidence or reasoning.
+- If you revise your earlier position, say so explicitly.
+- Critique arguments based on evidentiary strength and topic relevance,
+  and call out any detours into politeness or unrelated issues."""
+
+
 class DebateOrchestrator:
     """
     Coordinates a debate between a council of agents.
@@ -50,7 +140,7 @@ class DebateOrchestrator:
 
     It does NOT:
     - know any agent-specific prompts (that's in config + agents)
-    - call the LLM directly; it only works through BaseAgent.respond()
+    - call the LLM directly; it only works through BaseAgent.arespond()
     """
 
     def __init__(
@@ -68,55 +158,127 @@ class DebateOrchestrator:
         topic: DebateTopic,
         council: List[BaseAgent],
     ) -> DebateResult:
+        """
+        Run a full debate and return its transcript and consensus.
+
+        Thin wrapper around arun_debate(); it must not be called from a
+        running event loop (await arun_debate() there instead).
+
+        The event loop is owned by this call, so before it is closed the
+        agents' clients release their connection pools for it (see
+        LLMClient.aclose()).
+        """
+
+        async def run() -> DebateResult:
+            try:
+                return await self.arun_debate(topic, council)
+            finally:
+                await aclose_agent_clients(council)
+
+        return asyncio.run(run())
+
+    async def arun_debate(
+        self,
+        topic: DebateTopic,
+        council: List[BaseAgent],
+    ) -> DebateResult:
+        """
+        Run a full debate, awaiting agents concurrently where the protocol
+        allows it.
+
+        Clients are left open, since other debates on the same loop may be
+        using them; whoever owns the loop should await
+        aclose_agent_clients(council) before closing it.
+
+        Opening statements do not see each other, so all openings are
+        requested concurrently and then recorded in protocol order. Rebuttals
+        run one agent at a time so each one reads the transcript so far,
+        unless the protocol enables concurrent rebuttals; then every agent in
+        a round sees the transcript as it stood when the round began, and the
+        round is sent as batched LLM calls.
+        """
         transcript = DebateTranscript(topic=topic)
         round_index = 0
 
-        # Opening statements
-        for agent in self._protocol.opening_order(council):
-            content = self._run_agent_turn(
-                topic=topic,
-                transcript=transcript,
-                agent=agent,
-                stage=DebateStage.OPENING,
-            )
-            transcript.messages.append(
-                DebateMessage(
-                    speaker_id=agent.role_id,
-                    speaker_name=agent.name,
-                    role="assistant",
-                    content=content,
+        # Opening statements (concurrent)
+        opening_agents = self._protocol.opening_order(council)
+        contents = await self._gather_turns(
+            opening_agents,
+            [
+                self._build_conversation_for_agent(
+                    topic=topic,
+                    transcript=transcript,
+                    agent=agent,
                     stage=DebateStage.OPENING,
-                    round_index=round_index,
                 )
+                for agent in opening_agents
+            ],
+        )
+        for agent, content in zip(opening_agents, contents):
+            self._record_turn(
+                transcript,
+                agent=agent,
+                content=content,
+                stage=DebateStage.OPENING,
+                round_index=round_index,
             )
             round_index += 1
 
         # Rebuttal rounds
+        concurrent_rebuttals = self._protocol.concurrent_rebuttals()
         for r in range(self._protocol.num_rebuttal_rounds()):
-            for agent in self._protocol.rebuttal_order(council):
-                content = self._run_agent_turn(
+            rebuttal_agents = self._protocol.rebuttal_order(council)
+
+            if concurrent_rebuttals:
+                # The round's turns are independent, so send them as
+                # batches (one per client/model) instead of one by one.
+                contents = await BaseAgent.arespond_batch_across(
+                    rebuttal_agents,
+                    [
+                        self._build_conversation_for_agent(
+                            topic=topic,
+                            transcript=transcript,
+                            agent=agent,
+                            stage=DebateStage.REBUTTAL,
+                            rebuttal_round=r,
+                        )
+                        for agent in rebuttal_agents
+                    ],
+                )
+                for agent, content in zip(rebuttal_agents, contents):
+                    self._record_turn(
+                        transcript,
+                        agent=agent,
+                        content=content,
+                        stage=DebateStage.REBUTTAL,
+                        round_index=round_index,
+                    )
+                    round_index += 1
+                continue
+
+            for agent in rebuttal_agents:
+                conversation = self._build_conversation_for_agent(
                     topic=topic,
                     transcript=transcript,
                     agent=agent,
                     stage=DebateStage.REBUTTAL,
                     rebuttal_round=r,
                 )
-                transcript.messages.append(
-                    DebateMessage(
-                        speaker_id=agent.role_id,
-                        speaker_name=agent.name,
-                        role="assistant",
-                        content=content,
-                        stage=DebateStage.REBUTTAL,
-                        round_index=round_index,
-                    )
+                content = await agent.arespond(conversation)
+                self._record_turn(
+                    transcript,
+                    agent=agent,
+                    content=content,
+                    stage=DebateStage.REBUTTAL,
+                    round_index=round_index,
                 )
                 round_index += 1
 
         # Consensus
         consensus: Optional[ConsensusResult] = None
         if self._consensus_strategy is not None:
-            consensus = self._consensus_strategy.generate_consensus(
+            consensus = await asyncio.to_thread(
+                self._consensus_strategy.generate_consensus,
                 topic=topic,
                 transcript=transcript.messages,
                 council=council,
@@ -126,28 +288,54 @@ class DebateOrchestrator:
 
     # ---- Internal helpers ---------------------------------------------------
 
-    def _run_agent_turn(
-        self,
-        *,
-        topic: DebateTopic,
+    @staticmethod
+    def _record_turn(
         transcript: DebateTranscript,
+        *,
         agent: BaseAgent,
+        content: str,
         stage: DebateStage,
-        rebuttal_round: int | None = None,
-    ) -> str:
+        round_index: int,
+    ) -> None:
         """
-        Build the conversation for a single agent's turn and get their response.
+        Append a completed agent turn to the transcript.
         """
-        conversation = self._build_conversation_for_agent(
-            topic=topic,
-            transcript=transcript,
-            agent=agent,
-            stage=stage,
-            rebuttal_round=rebuttal_round,
+        transcript.messages.append(
+            DebateMessage(
+                speaker_id=agent.role_id,
+                speaker_name=agent.name,
+                role="assistant",
+                content=content,
+                stage=stage,
+                round_index=round_index,
+            )
         )
 
-        # We just use non-streaming for orchestrated debates.
-        return agent.respond(conversation)
+    @staticmethod
+    async def _gather_turns(
+        agents: List[BaseAgent],
+        conversations: List[List[ChatMessage]],
+    ) -> List[str]:
+        """
+        Request several independent agent turns concurrently, with at most
+        Settings.max_concurrent_llm requests in flight.
+
+        Returns one response per agent, in the order given.
+        """
+        limit = asyncio.Semaphore(get_settings().max_concurrent_llm)
+
+        async def turn(agent: BaseAgent, conversation: List[ChatMessage]) -> str:
+            async with limit:
+                return await agent.arespond(conversation)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    turn(agent, conversation)
+                    for agent, conversation in zip(agents, conversations)
+                )
+            )
+        )
 
     def _build_conversation_for_agent(
         self,
@@ -172,35 +360,15 @@ class DebateOrchestrator:
         """
         messages: List[ChatMessage] = []
 
-        if stage == DebateStage.OPENING:
-            stage_instructions = f"""
-You are {agent.name} participating in the opening round of the council debate.
-
-Task:
-- Present your analysis of the topic from your expertise.
-- Anticipate possible objections from other specialists.
-- Be explicit about sources, periods, and uncertainties.
-- You are NOT trying to be "balanced" for its own sake; you are trying
-  to be accurate, rigorous, and honest about trade-offs.
-- Keep every point tightly linked to the stated topic; avoid tangents or
-  virtue-signaling and let evidence drive your stance.
-            """.strip()
-        else:
-            stage_instructions = f"""
-You are {agent.name} participating in a rebuttal round of the council debate.
-
-Task:
-- Engage with previous statements from the other experts.
-- Point out where you agree and where you disagree, and WHY.
-- Bring in additional evidence or reasoning.
-- If you revise your earlier position, say so explicitly.
-- Critique arguments based on evidentiary strength and topic relevance,
-  and call out any detours into politeness or unrelated issues.
-            """.strip()
+        stage_instructions = (
+            _OPENING_INSTRUCTIONS
+            if stage == DebateStage.OPENING
+            else _REBUTTAL_INSTRUCTIONS
+        ).format(name=agent.name)
 
         topic_block = topic.as_user_prompt()
 
-        intro = f"{topic_block}\n\nStage: {stage.value.upper()}\n\n{stage_instructions}"
+        intro = f"{topic_block}\n\nStage: {stage.upper()}\n\n{stage_instructions}"
         if rebuttal_round is not None and stage == DebateStage.REBUTTAL:
             intro += f"\n\nRebuttal round: {rebuttal_round + 1}"
 
@@ -208,10 +376,12 @@ Task:
 
         if stage == DebateStage.REBUTTAL:
             # Add previous council messages as context. We represent each
-            # as an assistant message with speaker labels.
-            for msg in transcript.messages:
-                label = f"{msg.speaker_name} ({msg.stage.value}, #{msg.round_index})"
-                content = f"{label}:\n{msg.content}"
-                messages.append(ChatMessage(role="assistant", content=content))
+            # as an assistant message with speaker labels; the rendered
+            # messages are cached on the transcript and shared across turns.
+            context = transcript.context_messages()
+            window = self._protocol.context_window()
+            if window is not None:
+                context = context[-window:] if window > 0 else []
+            messages.extend(context)
 
         return messages
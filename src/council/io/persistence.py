@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
-from dataclasses import asdict
-from datetime import datetime
+import os
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Tuple
 
-from council.debate.orchestrator import DebateResult
-from council.debate.message import DebateMessage
+if TYPE_CHECKING:
+    # Annotation-only: importing the orchestrator pulls in the agents and
+    # the LLM client stack, which persistence never uses at runtime.
+    from council.debate.orchestrator import DebateResult
+    from council.debate.message import DebateMessage
 
 
 def _project_root() -> Path:
@@ -33,53 +40,174 @@ def _serialize_message(msg: DebateMessage) -> Dict[str, Any]:
     }
 
 
-def save_debate_result(result: DebateResult) -> Path:
+# Anything outside this set is replaced in filenames.
+_FILENAME_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+
+@lru_cache(maxsize=256)
+def _safe_topic_id(topic_id: str) -> str:
+    """
+    Make a topic id safe to use in a filename.
+
+    Cached because batch exports save many debates for the same topic.
+    """
+    return _FILENAME_UNSAFE_RE.sub("_", topic_id) or "topic"
+
+
+# Compact JSON for one message, matching json.dumps(_serialize_message(msg)).
+_MESSAGE_JSON_TEMPLATE = (
+    '{{"speaker_id": {}, "speaker_name": {}, "role": {}, '
+    '"content": {}, "stage": {}, "round_index": {}}}'
+)
+
+
+def _dumps(value: str) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _message_json(msg: DebateMessage) -> str:
+    """
+    Encode a message as compact JSON without building an intermediate dict.
+    """
+    return _MESSAGE_JSON_TEMPLATE.format(
+        _dumps(msg.speaker_id),
+        _dumps(msg.speaker_name),
+        _dumps(msg.role),
+        _dumps(msg.content),
+        _dumps(msg.stage.value),
+        int(msg.round_index),
+    )
+
+
+def _create_unique(directory: Path, stem: str) -> Tuple[Path, IO[str]]:
+    """
+    Create and open a new file `<stem>.json` in `directory`, or
+    `<stem>_2.json`, `<stem>_3.json`, ... if that name is taken.
+
+    Exclusive creation makes this safe when several saves of the same
+    topic land in the same second, including concurrent ones.
+    """
+    path = directory / f"{stem}.json"
+    n = 1
+    while True:
+        try:
+            return path, path.open("x", encoding="utf-8")
+        except FileExistsError:
+            n += 1
+            path = directory / f"{stem}_{n}.json"
+
+
+def save_debate_result(result: DebateResult, *, pretty: bool = False) -> Path:
     """
     Persist a DebateResult to JSON in the debates/ directory.
 
+    The file is written incrementally, one message at a time, so the whole
+    transcript is never held as a second in-memory copy. Set `pretty` to
+    indent the output for reading by hand.
+
+    Files are named `<UTC timestamp>_<topic id>.json`; a numeric suffix is
+    added when another debate on the topic was saved in the same second.
+
     Returns the path of the saved file.
     """
     debates_dir = _debates_dir()
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    topic_id = result.transcript.topic.id or "topic"
-    filename = f"{ts}_{topic_id}.json"
-
-    data: Dict[str, Any] = {
-        "meta": {
-            "saved_at_utc": ts,
-        },
-        "topic": {
-            "id": result.transcript.topic.id,
-            "title": result.transcript.topic.title,
-            "description": result.transcript.topic.description,
-            "constraints": result.transcript.topic.constraints,
-        },
-        "messages": [_serialize_message(m) for m in result.transcript.messages],
-        "consensus": (
-            {
-                "text": result.consensus.text,
-                "notes": result.consensus.notes,
-            }
-            if result.consensus
-            else None
-        ),
+    now = datetime.now(timezone.utc)
+    ts = (
+        f"{now.year:04d}{now.month:02d}{now.day:02d}"
+        f"T{now.hour:02d}{now.minute:02d}{now.second:02d}Z"
+    )
+    topic_id = _safe_topic_id(result.transcript.topic.id)
+
+    meta: Dict[str, Any] = {
+        "saved_at_utc": ts,
+    }
+    topic: Dict[str, Any] = {
+        "id": result.transcript.topic.id,
+        "title": result.transcript.topic.title,
+        "description": result.transcript.topic.description,
+        "constraints": result.transcript.topic.constraints,
     }
+    consensus = (
+        {
+            "text": result.consensus.text,
+            "notes": result.consensus.notes,
+        }
+        if result.consensus
+        else None
+    )
 
-    path = debates_dir / filename
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    indent = 2 if pretty else None
+    sep = ",\n" if pretty else ", "
+
+    def dump(obj: Any, f: Any) -> None:
+        json.dump(obj, f, ensure_ascii=False, indent=indent)
+
+    path, f = _create_unique(debates_dir, f"{ts}_{topic_id}")
+    with f:
+        f.write('{"meta": ')
+        dump(meta, f)
+        f.write(f'{sep}"topic": ')
+        dump(topic, f)
+        f.write(f'{sep}"messages": [')
+        for i, msg in enumerate(result.transcript.messages):
+            if i:
+                f.write(sep)
+            if pretty:
+                dump(_serialize_message(msg), f)
+            else:
+                f.write(_message_json(msg))
+        f.write(f']{sep}"consensus": ')
+        dump(consensus, f)
+        f.write("}")
 
     return path
 
 
+async def asave_debate_result(
+    result: DebateResult,
+    *,
+    pretty: bool = False,
+) -> Path:
+    """
+    Async variant of save_debate_result(); the blocking write runs in a
+    worker thread so the event loop is not held up by disk I/O.
+    """
+    return await asyncio.to_thread(save_debate_result, result, pretty=pretty)
+
+
+async def asave_debate_results(
+    results: List[DebateResult],
+    *,
+    pretty: bool = False,
+) -> List[Path]:
+    """
+    Save several debates concurrently.
+
+    Returns the saved paths in input order.
+    """
+    return list(
+        await asyncio.gather(
+            *(asave_debate_result(result, pretty=pretty) for result in results)
+        )
+    )
+
+
 def list_saved_debates(limit: int = 20) -> List[Path]:
     """
     Return up to `limit` most recent debate JSON files.
     """
     debates_dir = _debates_dir()
-    files = sorted(
-        debates_dir.glob("*.json"),
-        key=lambda p: p.name,
-        reverse=True,
-    )
-    return files[:limit]
\ No newline at end of file
+    # Filenames start with a UTC timestamp, so the largest names are the
+    # newest. scandir + nlargest avoids a per-entry stat and a full sort.
+    with os.scandir(debates_dir) as entries:
+        names = heapq.nlargest(
+            limit,
+            (
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ),
+        )
+    return [debates_dir / name for name in names]
\ No newline at end of file
@@ -3,6 +3,8 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import base64
+import functools
+import html
 
 # This file is: .../Agentic council/src/council/io/streamlit_app.py
 # We want to add: .../Agentic council/src  to sys.path
@@ -11,8 +13,11 @@ if str(SRC_ROOT) not in sys.path:
     sys.path.insert(0, str(SRC_ROOT))
 # --- end of path fix ---
 
+import queue
+import time
 import uuid
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 import streamlit as st
 
@@ -34,19 +39,24 @@ from council.io.persistence import save_debate_result, list_saved_debates
 # ---- Helper: expert images --------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1)
 def _project_root() -> Path:
     return Path(__file__).resolve().parents[3]
 
 
+@functools.lru_cache(maxsize=1)
 def _expert_image_dir() -> Path:
     # Expecting "expert images" at project root (unzipped from user's archive)
     return _project_root() / "expert images"
 
 
+@functools.lru_cache(maxsize=1)
 def _role_to_image_path() -> Dict[str, Path]:
     """
     Map agent.role_id to the corresponding expert image path.
 
+    Cached for the process lifetime; treat the returned dict as read-only.
+
     Based on filenames from the attached zip:
     - anthropology expert.png
     - civilizational historian.png
@@ -64,7 +74,10 @@ def _role_to_image_path() -> Dict[str, Path]:
     }
 
 
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
 def _encode_image(path: Path | None) -> str | None:
+    # Cached: otherwise every rerun (any widget interaction) would stat,
+    # read and base64-encode each portrait again.
     if path is None or not path.exists():
         return None
 
@@ -79,8 +92,9 @@ st.set_page_config(
     layout="wide",
 )
 
-st.markdown(
-    """
+# Static page styles. Reruns triggered inside the debate workspace fragment
+# skip this; only full-script reruns re-send it.
+_APP_CSS = """
     <style>
         /* Global polish */
         .main, .block-container {padding-top: 1rem;}
@@ -140,9 +154,9 @@ st.markdown(
         .expert-body {margin-top:0.65rem; border:1px solid #1f2937; border-radius:12px; background:#0b1221; padding:0.6rem;}
         .expert-stream {white-space: pre-wrap; font-family: 'JetBrains Mono', 'SFMono-Regular', Consolas, monospace; font-size: 0.92rem; border: 1px solid #233044; padding: 0.55rem; border-radius: 10px; max-height: 360px; overflow-y: auto; line-height: 1.55; background: #0f172a; color: #e2e8f0;}
     </style>
-    """,
-    unsafe_allow_html=True,
-)
+    """
+
+st.markdown(_APP_CSS, unsafe_allow_html=True)
 
 st.markdown(
     """
@@ -160,37 +174,31 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# ---- Sidebar: settings & saved debates -------------------------------------
-
-
-with st.sidebar:
-    st.header("Settings")
+# ---- Session state initialization ------------------------------------------
 
-    num_rebuttal_rounds = st.slider(
-        "Number of rebuttal rounds",
-        min_value=0,
-        max_value=3,
-        value=1,
-        help="How many full cycles of rebuttals after the opening statements.",
-    )
 
-    st.markdown("---")
-    st.subheader("Saved debates")
+@st.cache_resource
+def _shared_council() -> List[BaseAgent]:
+    """
+    Build the council once per server process.
 
-    saved_files = list_saved_debates(limit=10)
-    if not saved_files:
-        st.caption("No debates saved yet.")
-    else:
-        for f in saved_files:
-            st.caption(f"📄 {f.name}")
+    Agents hold only immutable config and the shared LLM client, so every
+    session can use the same instances.
+    """
+    return create_council()
 
 
-# ---- Session state initialization ------------------------------------------
+@st.cache_resource
+def _persist_pool() -> ThreadPoolExecutor:
+    """
+    Background writer for saving debates, shared across reruns and sessions.
+    """
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="council-save")
 
 
 def _init_session_state() -> None:
     if "council" not in st.session_state:
-        st.session_state.council: List[BaseAgent] = create_council()
+        st.session_state.council: List[BaseAgent] = _shared_council()
     if "latest_result" not in st.session_state:
         st.session_state.latest_result: DebateResult | None = None
     if "expert_buffers" not in st.session_state:
@@ -204,6 +212,61 @@ _init_session_state()
 council: List[BaseAgent] = st.session_state.council
 
 
+# ---- Sidebar: settings & saved debates -------------------------------------
+
+
+# Narrow questions usually only need the policymaker's view.
+_QUICK_MODE_DEFAULT_ROLE = "policymaker_expert"
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_saved_debates(limit: int) -> List[str]:
+    """
+    Names of the most recent saved debates.
+
+    Cached so reruns don't rescan the directory; cleared after each save.
+    """
+    return [path.name for path in list_saved_debates(limit=limit)]
+
+
+with st.sidebar:
+    st.header("Settings")
+
+    num_rebuttal_rounds = st.slider(
+        "Number of rebuttal rounds",
+        min_value=0,
+        max_value=3,
+        value=1,
+        help="How many full cycles of rebuttals after the opening statements.",
+    )
+
+    quick_mode = st.checkbox(
+        "Quick mode (single expert)",
+        value=False,
+        help="Ask one expert for an opening statement only; skips rebuttals and consensus.",
+    )
+    _agent_names = {agent.role_id: agent.name for agent in council}
+    quick_role_id = st.selectbox(
+        "Quick mode expert",
+        options=list(_agent_names),
+        index=list(_agent_names).index(_QUICK_MODE_DEFAULT_ROLE)
+        if _QUICK_MODE_DEFAULT_ROLE in _agent_names
+        else 0,
+        format_func=_agent_names.__getitem__,
+        disabled=not quick_mode,
+    )
+
+    st.markdown("---")
+    st.subheader("Saved debates")
+
+    saved_files = _cached_saved_debates(limit=10)
+    if not saved_files:
+        st.caption("No debates saved yet.")
+    else:
+        for name in saved_files:
+            st.caption(f"📄 {name}")
+
+
 # ---- Debate prompt input ----------------------------------------------------
 
 
@@ -228,14 +291,6 @@ with setup_right:
         help="Narrow the lens so experts don't wander: timeframes, evidence types, or red-lines.",
     )
 
-start_button = st.button(
-    "🔥 Start Live Debate",
-    type="primary",
-    use_container_width=True,
-    disabled=not bool(prompt.strip()),
-)
-
-
 # ---- Layout for experts -----------------------------------------------------
 
 
@@ -288,99 +343,199 @@ def build_expert_layout(council: List[BaseAgent]):
     return text_placeholders
 
 
+# Wrapper around an expert's live text; the buffer is concatenated in
+# between, since this runs on every throttled stream update.
+_EXPERT_STREAM_PREFIX = """
+        <div class="expert-stream">"""
+_EXPERT_STREAM_SUFFIX = """</div>
+        """
+
+
 def _render_buffer_in_placeholder(placeholder, buffer: str) -> None:
-    """Render a scrollable box with the expert's text."""
+    """
+    Render a scrollable box with the expert's text.
+
+    The text is model output, so it is escaped like the timeline cards:
+    stray tags in it must not break the layout or inject markup.
+    """
     placeholder.markdown(
-        f"""
-        <div class="expert-stream">{buffer}</div>
-        """,
+        _EXPERT_STREAM_PREFIX + html.escape(buffer) + _EXPERT_STREAM_SUFFIX,
         unsafe_allow_html=True,
     )
 
 
-def _stage_label(message: DebateMessage, *, total_agents: int) -> str:
-    if message.stage == DebateStage.OPENING:
-        return f"Opening statement #{message.round_index + 1}"
+class RenderThrottle:
+    """
+    Rate-limit UI re-renders of a live stream.
+
+    `ready()` returns True at most once per `interval` seconds; callers keep
+    accumulating text every chunk and only push it to Streamlit when ready,
+    plus one final flush when the stream ends.
+    """
+
+    def __init__(self, interval: float = 0.05) -> None:
+        self._interval = interval
+        self._last = 0.0
+
+    def ready(self) -> bool:
+        now = time.monotonic()
+        if now - self._last >= self._interval:
+            self._last = now
+            return True
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def _stage_label_for(stage: DebateStage, round_index: int, total_agents: int) -> str:
+    if stage == DebateStage.OPENING:
+        return f"Opening statement #{round_index + 1}"
 
     opening_count = total_agents
-    rebuttal_round = ((message.round_index - opening_count) // total_agents) + 1
-    rebuttal_turn = (message.round_index - opening_count) % total_agents + 1
+    rebuttal_round = ((round_index - opening_count) // total_agents) + 1
+    rebuttal_turn = (round_index - opening_count) % total_agents + 1
     return f"Rebuttal round {rebuttal_round}, turn {rebuttal_turn}"
 
 
-def _render_timeline(
-    placeholder: st.delta_generator.DeltaGenerator,
-    messages: List[DebateMessage],
-    *,
-    total_agents: int,
-    stage_filter: str,
-    preview_chars: int = 360,
-) -> None:
-    cards: List[str] = []
-    for msg in messages:
-        if stage_filter == "Opening only" and msg.stage != DebateStage.OPENING:
-            continue
-        if stage_filter == "Rebuttals only" and msg.stage != DebateStage.REBUTTAL:
-            continue
-
-        stage_class = "opening" if msg.stage == DebateStage.OPENING else "rebuttal"
-        stage_text = _stage_label(msg, total_agents=total_agents)
-        chip = "Opening" if msg.stage == DebateStage.OPENING else "Rebuttal"
-        preview = msg.content.replace("\n", " ").strip()
-        preview = (preview[: preview_chars] + "…") if len(preview) > preview_chars else preview
-        cards.append(
-            f"""
+def _stage_label(message: DebateMessage, *, total_agents: int) -> str:
+    return _stage_label_for(message.stage, message.round_index, total_agents)
+
+
+@functools.lru_cache(maxsize=256)
+def _preview_text(content: str, preview_chars: int) -> str:
+    # Keyed on the content string itself: str caches its hash, so repeat
+    # lookups for the same message don't rescan the text.
+    preview = content.replace("\n", " ").strip()
+    return (preview[: preview_chars] + "…") if len(preview) > preview_chars else preview
+
+
+_TIMELINE_CARD_TEMPLATE = """
             <div class="timeline-card {stage_class}">
-                <div class="timeline-speaker">{msg.speaker_name}</div>
+                <div class="timeline-speaker">{speaker}</div>
                 <div class="timeline-meta">
                     <span class="timeline-chip">{chip}</span>
-                    {stage_text} • Stage: {msg.stage.value.title()}
+                    {stage_text} • Stage: {stage}
                 </div>
                 <details>
                     <summary>Expand to view full response</summary>
                     <div class="preview">{preview}</div>
-                    <div class="full">{msg.content}</div>
+                    <div class="full">{content}</div>
                 </details>
             </div>
             """
-        )
 
-    placeholder.markdown(
-        """
+_TIMELINE_WRAPPER_TEMPLATE = """
         <div class="timeline-wrapper">
             {content}
         </div>
-        """.format(content="".join(cards) or "<p style='color:#94a3b8;'>Waiting for the first opening move…</p>"),
-        unsafe_allow_html=True,
+        """
+
+_TIMELINE_EMPTY_HTML = "<p style='color:#94a3b8;'>Waiting for the first opening move…</p>"
+
+
+def _format_timeline_card(
+    msg: DebateMessage,
+    *,
+    total_agents: int,
+    preview_chars: int,
+) -> str:
+    stage_class = "opening" if msg.stage == DebateStage.OPENING else "rebuttal"
+    stage_text = _stage_label(msg, total_agents=total_agents)
+    chip = "Opening" if msg.stage == DebateStage.OPENING else "Rebuttal"
+    preview = _preview_text(msg.content, preview_chars)
+    # LLM output is injected into raw HTML, so escape it. Cards are cached
+    # per message (see _timeline_cards), so this runs once per message.
+    return _TIMELINE_CARD_TEMPLATE.format(
+        stage_class=stage_class,
+        speaker=html.escape(msg.speaker_name),
+        chip=chip,
+        stage_text=stage_text,
+        stage=msg.stage.title(),
+        preview=html.escape(preview),
+        content=html.escape(msg.content),
     )
 
 
-st.markdown("### Debate workspace")
-timeline_tab, experts_tab = st.tabs(["🧭 Debate map", "👥 Expert dashboards"])
+def _timeline_cards(
+    messages: List[DebateMessage],
+    *,
+    total_agents: int,
+    preview_chars: int,
+    stage: DebateStage | None = None,
+) -> List[str]:
+    """
+    Return the card HTML per message (only for `stage`, if given),
+    formatting only the messages appended since the last render of the
+    same list.
+
+    Transcripts are append-only, so the cache (kept in session_state) is
+    reset only when a different list or different settings are passed.
+    Cards are also filed per stage as they are formatted, so a filtered
+    view is read from its own list without scanning the other stages.
+    """
+    key = (total_agents, preview_chars)
+    cache = st.session_state.get("timeline_cards")
+    if (
+        cache is None
+        or cache[0] is not messages
+        or cache[1] != key
+        or len(cache[2]) > len(messages)
+    ):
+        cache = (messages, key, [], {})
+        st.session_state.timeline_cards = cache
+
+    cards: List[str] = cache[2]
+    cards_by_stage: Dict[DebateStage, List[str]] = cache[3]
+    for msg in messages[len(cards):]:
+        card = _format_timeline_card(
+            msg, total_agents=total_agents, preview_chars=preview_chars
+        )
+        cards.append(card)
+        cards_by_stage.setdefault(msg.stage, []).append(card)
+
+    if stage is None:
+        return cards
+    return cards_by_stage.get(stage, [])
+
+
+# Timeline filter option -> the only stage it shows.
+_TIMELINE_FILTER_STAGES: Dict[str, DebateStage] = {
+    "Opening only": DebateStage.OPENING,
+    "Rebuttals only": DebateStage.REBUTTAL,
+}
+
+
+def _render_empty_timeline(placeholder: st.delta_generator.DeltaGenerator) -> None:
+    # Written directly: going through _timeline_cards() with a throwaway
+    # empty list would reset the card cache of the real transcript.
+    placeholder.markdown(
+        _TIMELINE_WRAPPER_TEMPLATE.format(content=_TIMELINE_EMPTY_HTML),
+        unsafe_allow_html=True,
+    )
+
 
-with timeline_tab:
-    st.caption("See every turn with stage labels and counters. Scroll inside the map, not the whole page.")
-    stage_filter = st.radio(
-        "Timeline filter",
-        options=["All stages", "Opening only", "Rebuttals only"],
-        index=0,
-        horizontal=True,
-        help="Filter the map to just openings or rebuttals to cut down visual noise.",
+def _render_timeline(
+    placeholder: st.delta_generator.DeltaGenerator,
+    messages: List[DebateMessage],
+    *,
+    total_agents: int,
+    stage_filter: str,
+    preview_chars: int = 360,
+) -> None:
+    content = "".join(
+        _timeline_cards(
+            messages,
+            total_agents=total_agents,
+            preview_chars=preview_chars,
+            stage=_TIMELINE_FILTER_STAGES.get(stage_filter),
+        )
     )
-    timeline_placeholder = st.container()
-    _render_timeline(
-        timeline_placeholder,
-        [],
-        total_agents=len(council),
-        stage_filter=stage_filter,
+
+    placeholder.markdown(
+        _TIMELINE_WRAPPER_TEMPLATE.format(content=content or _TIMELINE_EMPTY_HTML),
+        unsafe_allow_html=True,
     )
 
-with experts_tab:
-    st.caption("Compact expert dashboards with right-sized portraits and contained live transcripts.")
-    expert_placeholders = build_expert_layout(council)
 
-status_placeholder = st.empty()
-consensus_placeholder = st.container()
 
 
 # ---- Core live debate logic -------------------------------------------------
@@ -398,66 +553,147 @@ def build_topic_from_prompt(prompt: str, constraints: str) -> DebateTopic:
     )
 
 
+# Per-stage task text; only the agent's name varies, and it comes after the
+# shared topic block so the prompt prefix is identical across agents.
+_OPENING_INSTRUCTIONS = """\
+You are {name} participating in the opening round of the council debate.
+
+Task:
+- Present your analysis of the topic from your expertise.
+- Anticipate possible objections from other specialists.
+- Be explicit about sources, periods, and uncertainties.
+- You are NOT trying to be "balanced" for its own sake; you are trying
+  to be accurate, rigorous, and honest about trade-offs."""
+
+_REBUTTAL_INSTRUCTIONS = """\
+You are {name} participating in a rebuttal round of the council debate.
+
+Task:
+- Engage with previous statements from the other experts.
+- Point out where you agree and where you disagree, and WHY.
+- Bring in additional evidence or reasoning.
+- If you revise your earlier position, say so explicitly.
+- You may not see the entire transcript; focus on the recent points you see."""
+
+
+# Rebuttal prompts carry this many prior turns verbatim (about one council
+# round); older turns are only summarised.
+_REBUTTAL_RECENT_TURNS = 5
+
+
 def build_conversation_for_agent(
     *,
     topic: DebateTopic,
-    transcript_messages: List[DebateMessage],
+    transcript: DebateTranscript,
     agent: BaseAgent,
     stage: DebateStage,
     rebuttal_round: int | None = None,
+    recent_turns: int = _REBUTTAL_RECENT_TURNS,
 ) -> List[ChatMessage]:
     """
     Create the ChatMessage sequence that will be sent to a given agent.
 
-    IMPORTANT: With local models (e.g., Ollama) there is no strict token cap,
-    so we include the full transcript for rebuttals.
+    Rebuttals get the last `recent_turns` messages in full plus a one-line
+    digest of everything earlier, so later turns don't resend the whole
+    transcript.
     """
     messages: List[ChatMessage] = []
 
-    if stage == DebateStage.OPENING:
-        stage_instructions = f"""
-You are {agent.name} participating in the opening round of the council debate.
-
-Task:
-- Present your analysis of the topic from your expertise.
-- Anticipate possible objections from other specialists.
-- Be explicit about sources, periods, and uncertainties.
-- You are NOT trying to be "balanced" for its own sake; you are trying
-  to be accurate, rigorous, and honest about trade-offs.
-        """.strip()
-    else:
-        stage_instructions = f"""
-You are {agent.name} participating in a rebuttal round of the council debate.
-
-Task:
-- Engage with previous statements from the other experts.
-- Point out where you agree and where you disagree, and WHY.
-- Bring in additional evidence or reasoning.
-- If you revise your earlier position, say so explicitly.
-- You may not see the entire transcript; focus on the recent points you see.
-        """.strip()
+    stage_instructions = (
+        _OPENING_INSTRUCTIONS
+        if stage == DebateStage.OPENING
+        else _REBUTTAL_INSTRUCTIONS
+    ).format(name=agent.name)
 
     topic_block = topic.as_user_prompt()
-    intro = f"{topic_block}\n\nStage: {stage.value.upper()}\n\n{stage_instructions}"
+    intro = f"{topic_block}\n\nStage: {stage.upper()}\n\n{stage_instructions}"
     if rebuttal_round is not None and stage == DebateStage.REBUTTAL:
         intro += f"\n\nRebuttal round: {rebuttal_round + 1}"
 
     messages.append(ChatMessage(role="user", content=intro))
 
-    if stage == DebateStage.REBUTTAL and transcript_messages:
-        # Include the full transcript for maximum context
-        for msg in transcript_messages:
-            label = f"{msg.speaker_name} ({msg.stage.value}, #{msg.round_index})"
-            content = f"{label}:\n{msg.content}"
-            messages.append(ChatMessage(role="assistant", content=content))
+    if stage == DebateStage.REBUTTAL:
+        # Rendered turns and digest lines are cached on the transcript, so
+        # each agent only renders the turns since the previous call.
+        messages.extend(transcript.recent_context(recent_turns))
 
     return messages
 
 
+# Sentinel pushed by a stream worker when its agent has finished.
+_STREAM_DONE = object()
+
+
+def stream_agents_concurrently(
+    agents: List[BaseAgent],
+    conversations: List[List[ChatMessage]],
+    expert_placeholders: Dict[str, st.delta_generator.DeltaGenerator],
+) -> List[str]:
+    """
+    Stream several independent agent turns at the same time.
+
+    Each agent's stream is consumed in a worker thread that pushes chunks
+    onto a shared queue. This (script) thread drains the queue and does all
+    Streamlit writes, since elements must not be updated from other threads.
+    At most Settings.max_concurrent_llm agents stream at once.
+
+    Returns the final buffer per agent, in input order.
+    """
+    chunks: "queue.Queue[Tuple[int, object]]" = queue.Queue()
+
+    def pump(i: int, agent: BaseAgent, conv: List[ChatMessage]) -> None:
+        try:
+            for chunk in agent.respond_stream(conv):
+                chunks.put((i, chunk))
+        except Exception as exc:  # re-raised on the script thread
+            chunks.put((i, exc))
+        finally:
+            chunks.put((i, _STREAM_DONE))
+
+    # Chunks are collected in lists and only joined when rendering or at the
+    # end, avoiding quadratic string concatenation on long answers.
+    parts: List[List[str]] = [
+        [st.session_state.expert_buffers.get(a.role_id, "")] for a in agents
+    ]
+    placeholders = [expert_placeholders.get(a.role_id) for a in agents]
+    throttles = [RenderThrottle() for _ in agents]
+    results: List[str] = [""] * len(agents)
+
+    max_workers = max(min(len(agents), get_settings().max_concurrent_llm), 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for i, (agent, conv) in enumerate(zip(agents, conversations)):
+            pool.submit(pump, i, agent, conv)
+
+        remaining = len(agents)
+        while remaining:
+            i, item = chunks.get()
+            if item is _STREAM_DONE:
+                remaining -= 1
+                results[i] = "".join(parts[i])
+                st.session_state.expert_buffers[agents[i].role_id] = results[i]
+                # Final flush so the complete text is always shown.
+                if placeholders[i] is not None:
+                    _render_buffer_in_placeholder(placeholders[i], results[i])
+                continue
+            if isinstance(item, Exception):
+                raise item
+
+            parts[i].append(item)
+            if placeholders[i] is not None and throttles[i].ready():
+                _render_buffer_in_placeholder(placeholders[i], "".join(parts[i]))
+
+    return [result or "(no response)" for result in results]
+
+
 def run_live_debate(
     topic: DebateTopic,
     num_rebuttal_rounds: int,
     timeline_placeholder: st.delta_generator.DeltaGenerator,
+    *,
+    expert_placeholders: Dict[str, st.delta_generator.DeltaGenerator],
+    status_placeholder: st.delta_generator.DeltaGenerator,
+    stage_filter: str,
+    quick_expert: BaseAgent | None = None,
 ) -> DebateResult:
     """
     Run a full debate with live streaming into the UI.
@@ -465,148 +701,201 @@ def run_live_debate(
     - Uses the existing council from session_state.
     - Streams each agent's turn into their placeholder.
     - At the end, calls the consensus strategy.
+
+    If `quick_expert` is given, only that agent gives an opening statement
+    and both the rebuttals and the consensus are skipped.
     """
+    speakers = council
+    if quick_expert is not None:
+        speakers = [quick_expert]
+        num_rebuttal_rounds = 0
+
     protocol = BasicDebateProtocol(RoundConfig(num_rebuttal_rounds=num_rebuttal_rounds))
     consensus_strategy = PolicyLeadConsensusStrategy()
 
     transcript = DebateTranscript(topic=topic)
-    round_index = 0
-    total_agents = len(council)
-
-    # Opening statements
-    status_placeholder.info("Opening statements in progress...")
-    for agent in protocol.opening_order(council):
-        conv = build_conversation_for_agent(
-            topic=topic,
-            transcript_messages=transcript.messages,
-            agent=agent,
-            stage=DebateStage.OPENING,
+    total_agents = len(speakers)
+
+    def _run_turns(
+        agents: List[BaseAgent],
+        stage: DebateStage,
+        rebuttal_round: int | None = None,
+    ) -> List[DebateMessage]:
+        """
+        Stream one turn for each of `agents`, append the resulting messages
+        to the transcript and re-render the timeline once.
+
+        The conversations are built before any of the turns are recorded,
+        so only agents that must not see each other's turn belong together.
+        """
+        conversations = [
+            build_conversation_for_agent(
+                topic=topic,
+                transcript=transcript,
+                agent=agent,
+                stage=stage,
+                rebuttal_round=rebuttal_round,
+            )
+            for agent in agents
+        ]
+        contents = stream_agents_concurrently(
+            agents, conversations, expert_placeholders
         )
-
-        placeholder = expert_placeholders.get(agent.role_id)
-        role_id = agent.role_id
-
-        if placeholder is None:
-            content = agent.respond(conv)
-        else:
-            buffer = st.session_state.expert_buffers.get(role_id, "")
-            for chunk in agent.respond_stream(conv):
-                buffer += chunk
-                st.session_state.expert_buffers[role_id] = buffer
-                _render_buffer_in_placeholder(placeholder, buffer)
-            content = buffer or "(no response)"
-
-        transcript.messages.append(
+        first_index = len(transcript.messages)
+        messages = [
             DebateMessage(
                 speaker_id=agent.role_id,
                 speaker_name=agent.name,
                 role="assistant",
                 content=content,
-                stage=DebateStage.OPENING,
-                round_index=round_index,
+                stage=stage,
+                round_index=first_index + i,
             )
-        )
+            for i, (agent, content) in enumerate(zip(agents, contents))
+        ]
+        transcript.messages.extend(messages)
         _render_timeline(
             timeline_placeholder,
             transcript.messages,
             total_agents=total_agents,
             stage_filter=stage_filter,
         )
-        round_index += 1
+        return messages
+
+    # Opening statements don't read the transcript, so they are streamed
+    # concurrently as one batch.
+    status_placeholder.info("Opening statements in progress...")
+    _run_turns(protocol.opening_order(speakers), DebateStage.OPENING)
 
-    # Rebuttal rounds
+    # Rebuttals see every turn before them, so they run one at a time.
     if num_rebuttal_rounds > 0:
         status_placeholder.info("Rebuttal rounds in progress...")
     for r in range(num_rebuttal_rounds):
-        for agent in protocol.rebuttal_order(council):
-            conv = build_conversation_for_agent(
-                topic=topic,
-                transcript_messages=transcript.messages,
-                agent=agent,
-                stage=DebateStage.REBUTTAL,
-                rebuttal_round=r,
-            )
+        for agent in protocol.rebuttal_order(speakers):
+            _run_turns([agent], DebateStage.REBUTTAL, r)
+
+    # A single opening statement is already the answer in quick mode.
+    consensus: ConsensusResult | None = None
+    if quick_expert is None:
+        status_placeholder.info("Generating council consensus...")
+        consensus = consensus_strategy.generate_consensus(
+            topic=topic,
+            transcript=transcript.messages,
+            council=council,
+        )
 
-            placeholder = expert_placeholders.get(agent.role_id)
-            role_id = agent.role_id
+    result = DebateResult(transcript=transcript, consensus=consensus)
+    return result
 
-            if placeholder is None:
-                content = agent.respond(conv)
-            else:
-                buffer = st.session_state.expert_buffers.get(role_id, "")
-                for chunk in agent.respond_stream(conv):
-                    buffer += chunk
-                    st.session_state.expert_buffers[role_id] = buffer
-                    _render_buffer_in_placeholder(placeholder, buffer)
-                content = buffer or "(no response)"
-
-            transcript.messages.append(
-                DebateMessage(
-                    speaker_id=agent.role_id,
-                    speaker_name=agent.name,
-                    role="assistant",
-                    content=content,
-                    stage=DebateStage.REBUTTAL,
-                    round_index=round_index,
-                )
-            )
-            _render_timeline(
-                timeline_placeholder,
-                transcript.messages,
-                total_agents=total_agents,
-                stage_filter=stage_filter,
-            )
-            round_index += 1
 
-    status_placeholder.info("Generating council consensus...")
-    consensus: ConsensusResult | None = consensus_strategy.generate_consensus(
-        topic=topic,
-        transcript=transcript.messages,
-        council=council,
+# ---- Debate workspace (fragment) -------------------------------------------
+
+
+@st.fragment
+def _debate_workspace(
+    prompt: str,
+    constraints: str,
+    num_rebuttal_rounds: int,
+    quick_role_id: str | None,
+) -> None:
+    """
+    Start button, timeline, expert dashboards and consensus.
+
+    Runs as a fragment, so interacting with widgets in here (e.g. the
+    timeline filter) reruns only this function instead of the whole script.
+    The start button lives inside the fragment so a fragment rerun never
+    replays a stale click captured from a full-script run.
+    """
+    start_button = st.button(
+        "🔥 Start Live Debate",
+        type="primary",
+        use_container_width=True,
+        disabled=not bool(prompt.strip()),
     )
 
-    result = DebateResult(transcript=transcript, consensus=consensus)
-    return result
+    st.markdown("### Debate workspace")
+    timeline_tab, experts_tab = st.tabs(["🧭 Debate map", "👥 Expert dashboards"])
+
+    with timeline_tab:
+        st.caption("See every turn with stage labels and counters. Scroll inside the map, not the whole page.")
+        stage_filter = st.radio(
+            "Timeline filter",
+            options=["All stages", "Opening only", "Rebuttals only"],
+            index=0,
+            horizontal=True,
+            help="Filter the map to just openings or rebuttals to cut down visual noise.",
+        )
+        # st.empty so each render replaces the map instead of appending a copy.
+        timeline_placeholder = st.empty()
 
+    starting = start_button and prompt.strip()
+    latest_result: DebateResult | None = st.session_state.get("latest_result")
+    # The last run's map is drawn below; otherwise show the empty state
+    # until the live debate fills it in.
+    if starting or latest_result is None:
+        _render_empty_timeline(timeline_placeholder)
 
-# ---- Run debate on button click --------------------------------------------
+    with experts_tab:
+        st.caption("Compact expert dashboards with right-sized portraits and contained live transcripts.")
+        expert_placeholders = build_expert_layout(council)
 
+    status_placeholder = st.empty()
+    consensus_placeholder = st.container()
 
-if start_button and prompt.strip():
-    topic = build_topic_from_prompt(prompt, constraints)
+    if starting:
+        topic = build_topic_from_prompt(prompt, constraints)
 
-    with st.spinner("Running live debate..."):
-        result = run_live_debate(
-            topic=topic,
-            num_rebuttal_rounds=num_rebuttal_rounds,
-            timeline_placeholder=timeline_placeholder,
-        )
+        with st.spinner("Running live debate..."):
+            result = run_live_debate(
+                topic=topic,
+                num_rebuttal_rounds=num_rebuttal_rounds,
+                timeline_placeholder=timeline_placeholder,
+                expert_placeholders=expert_placeholders,
+                status_placeholder=status_placeholder,
+                stage_filter=stage_filter,
+                quick_expert=next(
+                    (agent for agent in council if agent.role_id == quick_role_id),
+                    None,
+                ),
+            )
 
-    # Persist in session and to disk
-    st.session_state.latest_result = result
-    path = save_debate_result(result)
-    status_placeholder.success(f"Debate completed and saved to: {path}")
-
-    # Show consensus
-    with consensus_placeholder:
-        st.markdown("### 🧾 Council Consensus")
-        if result.consensus:
-            st.markdown(result.consensus.text)
-        else:
-            st.caption("No consensus generated.")
-
-# If we already have a result from a previous run this session, show its consensus
-elif st.session_state.get("latest_result") is not None:
-    result: DebateResult = st.session_state.latest_result
-    _render_timeline(
-        timeline_placeholder,
-        result.transcript.messages,
-        total_agents=len(council),
-        stage_filter=stage_filter,
-    )
-    with consensus_placeholder:
-        st.markdown("### 🧾 Council Consensus (last run)")
-        if result.consensus:
-            st.markdown(result.consensus.text)
-        else:
-            st.caption("No consensus generated.")
\ No newline at end of file
+        # Persist in session and to disk; the file is written in the
+        # background so the consensus shows without waiting on disk I/O.
+        st.session_state.latest_result = result
+        saved = _persist_pool().submit(save_debate_result, result)
+
+        # Show consensus
+        with consensus_placeholder:
+            st.markdown("### 🧾 Council Consensus")
+            if result.consensus:
+                st.markdown(result.consensus.text)
+            else:
+                st.caption("No consensus generated.")
+
+        path = saved.result()
+        _cached_saved_debates.clear()
+        status_placeholder.success(f"Debate completed and saved to: {path}")
+
+    # If we already have a result from a previous run this session, show its consensus
+    elif latest_result is not None:
+        result = latest_result
+        _render_timeline(
+            timeline_placeholder,
+            result.transcript.messages,
+            total_agents=len(council),
+            stage_filter=stage_filter,
+        )
+        with consensus_placeholder:
+            st.markdown("### 🧾 Council Consensus (last run)")
+            if result.consensus:
+                st.markdown(result.consensus.text)
+            else:
+                st.caption("No consensus generated.")
+
+
+_debate_workspace(
+    prompt,
+    constraints,
+    num_rebuttal_rounds,
+    quick_role_id if quick_mode else None,
+)
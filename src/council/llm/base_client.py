@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, Iterator, Literal, Optional
+from typing import Iterable, Iterator, List, Literal, Optional
 
 
 Role = Literal["system", "user", "assistant"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChatMessage:
     """
     Simple chat message model, independent of any specific LLM provider.
+
+    Slotted so long transcripts don't carry a per-message __dict__.
     """
     role: Role
     content: str
@@ -59,3 +63,97 @@ class LLMClient(ABC):
         for joining them if needed.
         """
         raise NotImplementedError
+
+    async def acomplete(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> str:
+        """
+        Async non-streaming completion.
+
+        The default implementation runs `complete()` in a worker thread so
+        callers can await several completions concurrently; clients with a
+        native async SDK can override this.
+        """
+        return await asyncio.to_thread(
+            self.complete,
+            list(messages),
+            model_alias=model_alias,
+            **overrides,
+        )
+
+    async def aclose(self) -> None:
+        """
+        Release any resources bound to the running event loop (e.g. an async
+        connection pool), before the loop is closed.
+
+        The default implementation holds none and does nothing.
+        """
+
+    def complete_batch(
+        self,
+        batch: Iterable[Iterable[ChatMessage]],
+        *,
+        model_alias: Optional[str] = None,
+        max_concurrency: int = 8,
+        **overrides,
+    ) -> List[str]:
+        """
+        Run several independent non-streaming completions.
+
+        Returns one response per conversation, in input order. The default
+        implementation fans `complete()` out over a thread pool of at most
+        `max_concurrency` workers; clients whose provider has a native batch
+        endpoint can override this.
+        """
+        conversations = [list(messages) for messages in batch]
+        if not conversations:
+            return []
+
+        workers = max(min(len(conversations), max_concurrency), 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Submit everything before collecting, so the calls overlap.
+            futures = [
+                pool.submit(
+                    self.complete,
+                    messages,
+                    model_alias=model_alias,
+                    **overrides,
+                )
+                for messages in conversations
+            ]
+            return [future.result() for future in futures]
+
+    async def acomplete_batch(
+        self,
+        batch: Iterable[Iterable[ChatMessage]],
+        *,
+        model_alias: Optional[str] = None,
+        max_concurrency: int = 8,
+        **overrides,
+    ) -> List[str]:
+        """
+        Async variant of `complete_batch()`.
+
+        Awaits `acomplete()` for every conversation with at most
+        `max_concurrency` requests in flight, so clients with a native async
+        implementation get concurrent I/O without extra threads.
+
+        Returns one response per conversation, in input order.
+        """
+        limit = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def one(messages: List[ChatMessage]) -> str:
+            async with limit:
+                return await self.acomplete(
+                    messages,
+                    model_alias=model_alias,
+                    **overrides,
+                )
+
+        return list(
+            await asyncio.gather(*(one(list(messages)) for messages in batch))
+        )
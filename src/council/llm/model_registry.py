@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import atexit
+import threading
 from typing import Dict
 
 from council.config.settings import ModelConfig, get_settings
 from council.llm.base_client import LLMClient
-from council.llm.ollama_client import OllamaLLMClient
 
 
 # Simple global cache so we don't recreate clients everywhere
 _LLM_CLIENT: LLMClient | None = None
+_LLM_CLIENT_LOCK = threading.Lock()
 
 
 def get_llm_client() -> LLMClient:
@@ -17,11 +19,25 @@ def get_llm_client() -> LLMClient:
 
     Currently this is an OllamaLLMClient, but higher-level code should depend on
     the LLMClient interface, not on the concrete type.
+
+    The client is a process-wide singleton, so every agent shares one HTTP
+    connection pool; it is closed at interpreter exit. Creation is guarded
+    by a lock because Streamlit sessions run on separate threads.
+
+    The Ollama SDK (and pydantic with it) is imported here rather than at
+    module level, so importing the council package stays cheap until a
+    client is actually needed.
     """
     global _LLM_CLIENT
     if _LLM_CLIENT is None:
-        settings = get_settings()
-        _LLM_CLIENT = OllamaLLMClient.from_settings(settings)
+        with _LLM_CLIENT_LOCK:
+            if _LLM_CLIENT is None:
+                from council.llm.ollama_client import OllamaLLMClient
+
+                settings = get_settings()
+                client = OllamaLLMClient.from_settings(settings)
+                atexit.register(client.close)
+                _LLM_CLIENT = client
     return _LLM_CLIENT
 
 
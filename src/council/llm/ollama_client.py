@@ -1,11 +1,41 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Iterator, List, Optional
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from ollama import Client  # type: ignore
+import httpx
+from ollama import AsyncClient, Client, ResponseError  # type: ignore
 
 from council.config.settings import ModelConfig, Settings
 from council.llm.base_client import ChatMessage, LLMClient
+from council.utils.memo import make_cache_key
+
+
+class _RequestAbandoned(Exception):
+    """The caller sending a shared request was cancelled before it finished."""
+
+
+# HTTP statuses worth retrying: the server is busy or restarting.
+_RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, ResponseError):
+        return exc.status_code in _RETRYABLE_STATUS
+    # The SDK re-raises httpx.ConnectError as the builtin ConnectionError;
+    # timeouts and dropped connections surface as httpx errors.
+    return isinstance(
+        exc,
+        (
+            ConnectionError,
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            httpx.RemoteProtocolError,
+        ),
+    )
 
 
 class OllamaLLMClient(LLMClient):
@@ -24,10 +54,40 @@ class OllamaLLMClient(LLMClient):
         host: str,
         models: Dict[str, ModelConfig],
         default_model_alias: str,
+        max_connections: int = 32,
+        connect_timeout: float = 5.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
     ) -> None:
-        self._client = Client(host=host)
+        # One pooled httpx client per instance; keep-alive connections are
+        # reused across calls instead of reconnecting for every request.
+        # Only connecting is time-limited: a local model can legitimately
+        # take minutes to finish a long completion.
+        self._host = host
+        self._http_options: Dict[str, Any] = {
+            "limits": httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            "timeout": httpx.Timeout(None, connect=connect_timeout),
+        }
+        self._client = Client(host=host, **self._http_options)
+        # Async clients are bound to the event loop they were first used on,
+        # so keep one pooled client per loop. The client references its loop,
+        # so entries must be released explicitly with aclose().
+        self._async_clients: Dict[asyncio.AbstractEventLoop, AsyncClient] = {}
+        self._async_clients_lock = threading.Lock()
         self._models = models
         self._default_model_alias = default_model_alias
+        # Resolved up-front: council agents all use the default alias unless
+        # configured otherwise. None if the alias is unknown (fails on use).
+        self._default_model_config = models.get(default_model_alias)
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        # Identical complete()/acomplete() calls already in flight share one
+        # request, whichever thread or event loop they come from.
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     # ---- Public factory helpers ---------------------------------------------
 
@@ -39,13 +99,87 @@ class OllamaLLMClient(LLMClient):
             default_model_alias=settings.default_model_alias,
         )
 
+    def close(self) -> None:
+        """
+        Close the underlying HTTP connection pool.
+        """
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the async connection pool bound to the running event loop.
+
+        The next acomplete() on this loop opens a new pool.
+        """
+        with self._async_clients_lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
     # ---- Internal helpers ----------------------------------------------------
 
+    def _async_client(self) -> AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            with self._async_clients_lock:
+                # Loops that ended without aclose() can't use (or close)
+                # their clients any more; drop them so they can be freed.
+                for stale in [l for l in self._async_clients if l.is_closed()]:
+                    del self._async_clients[stale]
+                client = AsyncClient(host=self._host, **self._http_options)
+                self._async_clients[loop] = client
+        return client
+
+    def _join_inflight(self, key: str) -> Tuple[Future, bool]:
+        """
+        Return the future for an in-flight request with this key, and
+        whether the caller created it (and so must send the request and
+        settle the future).
+        """
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is not None:
+                return pending, False
+            future: Future = Future()
+            # Marked running so a cancelled waiter cannot cancel it for
+            # everyone else.
+            future.set_running_or_notify_cancel()
+            self._inflight[key] = future
+            return future, True
+
+    def _settle_inflight(
+        self,
+        key: str,
+        future: Future,
+        *,
+        result: str = "",
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Drop the in-flight entry, then wake the requests waiting on it.
+
+        If the owner was cancelled or interrupted, waiters are not handed
+        its cancellation: they get _RequestAbandoned and send the request
+        again. The entry is dropped first so that retry starts a new one.
+        """
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+        if error is None:
+            future.set_result(result)
+        elif isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            future.set_exception(_RequestAbandoned())
+
     def _resolve_model_config(
         self,
         model_alias: Optional[str],
     ) -> ModelConfig:
         alias = model_alias or self._default_model_alias
+        cfg = self._default_model_config
+        if cfg is not None and alias == self._default_model_alias:
+            return cfg
         try:
             return self._models[alias]
         except KeyError as exc:
@@ -55,8 +189,10 @@ class OllamaLLMClient(LLMClient):
             ) from exc
 
     @staticmethod
-    def _to_ollama_messages(messages: Iterable[ChatMessage]) -> List[Dict[str, str]]:
-        return [{"role": m.role, "content": m.content} for m in messages]
+    def _to_ollama_messages(messages: Iterable[ChatMessage]) -> Iterator[Dict[str, str]]:
+        # Lazy: the SDK copies each message as it iterates the payload once,
+        # so building an intermediate list here would be thrown away.
+        return ({"role": m.role, "content": m.content} for m in messages)
 
     def _build_payload(
         self,
@@ -122,19 +258,119 @@ class OllamaLLMClient(LLMClient):
 
         Returns a full assistant message string. If the provider returns
         multiple choices, we just take the content field.
+
+        A call identical to one still in flight (same messages, model and
+        overrides) waits for that request instead of sending its own, and
+        sends it again only if the caller that started it was cancelled.
+        Connection failures and busy-server responses are retried up to
+        `max_retries` times with exponential backoff.
         """
-        payload = self._build_payload(
-            messages,
-            model_alias,
-            overrides,
-            force_stream=False,
-        )
+        messages = list(messages)
+        key = make_cache_key(messages, model_alias or self._default_model_alias, overrides)
+        while True:
+            future, owner = self._join_inflight(key)
+            if owner:
+                break
+            try:
+                return future.result()
+            except _RequestAbandoned:
+                continue
+
+        try:
+            content = self._complete_with_retry(messages, model_alias, overrides)
+        except BaseException as exc:
+            self._settle_inflight(key, future, error=exc)
+            raise
+        self._settle_inflight(key, future, result=content)
+        return content
+
+    def _complete_with_retry(
+        self,
+        messages: List[ChatMessage],
+        model_alias: Optional[str],
+        overrides: Dict[str, Any],
+    ) -> str:
+        attempt = 0
+        while True:
+            # Rebuilt per attempt: the payload's message iterable is lazy.
+            payload = self._build_payload(
+                messages,
+                model_alias,
+                overrides,
+                force_stream=False,
+            )
+            try:
+                completion = self._client.chat(**payload)
+            except Exception as exc:
+                if attempt >= self._max_retries or not _is_retryable(exc):
+                    raise
+                time.sleep(self._retry_backoff * (2 ** attempt))
+                attempt += 1
+                continue
+            message = completion.get("message") or {}
+            content = message.get("content") or ""
+            return content
+
+    async def acomplete(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides: Any,
+    ) -> str:
+        """
+        Async non-streaming completion.
 
-        completion = self._client.chat(**payload)
-        message = completion.get("message") or {}
-        content = message.get("content") or ""
+        Uses Ollama's async client instead of a worker thread, so concurrent
+        turns share one event loop and its connection pool. In-flight
+        deduplication and retries work as in complete(), with the backoff
+        awaited rather than slept.
+        """
+        messages = list(messages)
+        key = make_cache_key(messages, model_alias or self._default_model_alias, overrides)
+        while True:
+            future, owner = self._join_inflight(key)
+            if owner:
+                break
+            try:
+                return await asyncio.wrap_future(future)
+            except _RequestAbandoned:
+                continue
+
+        try:
+            content = await self._acomplete_with_retry(messages, model_alias, overrides)
+        except BaseException as exc:
+            self._settle_inflight(key, future, error=exc)
+            raise
+        self._settle_inflight(key, future, result=content)
         return content
 
+    async def _acomplete_with_retry(
+        self,
+        messages: List[ChatMessage],
+        model_alias: Optional[str],
+        overrides: Dict[str, Any],
+    ) -> str:
+        attempt = 0
+        while True:
+            payload = self._build_payload(
+                messages,
+                model_alias,
+                overrides,
+                force_stream=False,
+            )
+            try:
+                completion = await self._async_client().chat(**payload)
+            except Exception as exc:
+                if attempt >= self._max_retries or not _is_retryable(exc):
+                    raise
+                await asyncio.sleep(self._retry_backoff * (2 ** attempt))
+                attempt += 1
+                continue
+            message = completion.get("message") or {}
+            content = message.get("content") or ""
+            return content
+
     def stream(
         self,
         messages: Iterable[ChatMessage],
@@ -145,8 +381,15 @@ class OllamaLLMClient(LLMClient):
         """
         Streaming completion.
 
-        Yields text chunks from the incremental message content for each update.
+        Yields the incremental message content, grouping provider deltas
+        until ModelConfig.stream_batch_chars characters are pending or
+        ModelConfig.stream_flush_ms has passed since the previous yield.
+        The deadline is checked as each delta arrives, so a slow model's
+        deltas are passed on one by one rather than held back.
         """
+        cfg = self._resolve_model_config(model_alias)
+        batch_chars = cfg.stream_batch_chars
+        flush_after = cfg.stream_flush_ms / 1000.0
         payload = self._build_payload(
             messages,
             model_alias,
@@ -154,9 +397,23 @@ class OllamaLLMClient(LLMClient):
             force_stream=True,
         )
 
+        pending: List[str] = []
+        pending_len = 0
+        last_yield = float("-inf")  # the first delta goes out at once
         completion_stream = self._client.chat(**payload)
         for chunk in completion_stream:
             message = chunk.get("message") or {}
             text = message.get("content") or ""
-            if text:
-                yield text
+            if not text:
+                continue
+            pending.append(text)
+            pending_len += len(text)
+            now = time.monotonic()
+            if pending_len >= batch_chars or now - last_yield >= flush_after:
+                yield "".join(pending)
+                pending.clear()
+                pending_len = 0
+                last_yield = now
+
+        if pending:
+            yield "".join(pending)
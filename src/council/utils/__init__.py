@@ -7,6 +7,7 @@ from .text import (
     strip_markdown,
 )
 from .tracing import trace_block, traced
+from .memo import ResponseCache, get_response_cache, make_cache_key
 
 __all__ = [
     "normalize_whitespace",
@@ -15,4 +16,7 @@ __all__ = [
     "strip_markdown",
     "trace_block",
     "traced",
+    "ResponseCache",
+    "get_response_cache",
+    "make_cache_key",
 ]
\ No newline at end of file
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from council.config.settings import get_settings
+from council.llm.base_client import ChatMessage
+
+
+def make_cache_key(
+    messages: Iterable[ChatMessage],
+    model_alias: Optional[str],
+    overrides: Dict[str, Any],
+) -> str:
+    """
+    Build a content-addressed key for a completion request.
+
+    The key covers the full message list (including the system prompt),
+    the model alias, and any per-call overrides, so two requests share a key
+    only if they would send the same payload to the LLM.
+    """
+    payload = json.dumps(
+        [
+            [(m.role, m.content) for m in messages],
+            model_alias,
+            sorted(overrides.items()),
+        ],
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-level cache of LLM responses.
+
+    - an in-process LRU of the most recent `maxsize` entries
+    - an optional SQLite file so responses survive across processes
+
+    Intended for dev/test runs where the same prompts are replayed; it is
+    off by default (see Settings.enable_response_cache).
+    """
+
+    def __init__(self, path: Path | None = None, *, maxsize: int = 128) -> None:
+        self._maxsize = maxsize
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            content = self._memory.get(key)
+            if content is not None:
+                self._memory.move_to_end(key)
+                return content
+
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, key: str, content: str) -> None:
+        with self._lock:
+            self._remember(key, content)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)",
+                    (key, content),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, content: str) -> None:
+        self._memory[key] = content
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._maxsize:
+            self._memory.popitem(last=False)
+
+
+# Lazily created so the SQLite file is only opened when caching is enabled,
+# and recreated if Settings.response_cache_path changes (override_settings()).
+# Held as one (path, cache) tuple so readers outside the lock see a
+# consistent pair.
+_RESPONSE_CACHE: Optional[Tuple[str, ResponseCache]] = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Return the shared ResponseCache for the configured path, or None if
+    response caching is disabled in Settings.
+
+    Creation is guarded by a lock because agents respond from worker
+    threads; otherwise two threads could each open the SQLite file.
+    """
+    global _RESPONSE_CACHE
+    settings = get_settings()
+    if not settings.enable_response_cache:
+        return None
+    path = settings.response_cache_path
+    entry = _RESPONSE_CACHE
+    if entry is None or entry[0] != path:
+        with _RESPONSE_CACHE_LOCK:
+            entry = _RESPONSE_CACHE
+            if entry is None or entry[0] != path:
+                entry = (path, ResponseCache(Path(path).expanduser()))
+                _RESPONSE_CACHE = entry
+    return entry[1]
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import re
-from typing import Optional
+from functools import lru_cache
 
 
-_WHITESPACE_RE = re.compile(r"\s+")
+# Inputs shorter than this (agent names, stage labels, headers) recur often
+# and are served from an LRU cache; longer model output is almost always
+# unique and would only churn it.
+_CACHED_TEXT_CHARS = 256
 
 
 def normalize_whitespace(text: str) -> str:
@@ -16,7 +19,23 @@ def normalize_whitespace(text: str) -> str:
     """
     if not text:
         return ""
-    return _WHITESPACE_RE.sub(" ", text).strip()
+    if len(text) < _CACHED_TEXT_CHARS:
+        return _normalize_whitespace_cached(text)
+    return _normalize_whitespace(text)
+
+
+def _normalize_whitespace(text: str) -> str:
+    # Fast path: every whitespace character other than a plain space is
+    # non-printable, so a printable string without double spaces has
+    # nothing to collapse and only needs stripping.
+    if "  " not in text and text.isprintable():
+        return text.strip()
+    # str.split() with no separator splits on the same characters as the
+    # regex \s and drops leading/trailing runs, so no regex is needed.
+    return " ".join(text.split())
+
+
+_normalize_whitespace_cached = lru_cache(maxsize=512)(_normalize_whitespace)
 
 
 def truncate_chars(
@@ -35,13 +54,17 @@ def truncate_chars(
         return ""
     if len(text) <= max_chars:
         return text
-    if len(suffix) >= max_chars:
+    suffix_len = len(suffix)
+    if suffix_len >= max_chars:
         # Degenerate case: suffix longer than limit
         return suffix[:max_chars]
-    return text[: max_chars - len(suffix)] + suffix
+    return text[: max_chars - suffix_len] + suffix
 
 
 _MARKDOWN_SPECIAL_CHARS = r"\`*_{}[]()#+-.!"
+# (char, escaped) pairs; the backslash comes first so the escapes added for
+# later characters are not escaped again.
+_MARKDOWN_ESCAPES = tuple((ch, "\\" + ch) for ch in _MARKDOWN_SPECIAL_CHARS)
 
 
 def safe_markdown(text: str) -> str:
@@ -55,13 +78,29 @@ def safe_markdown(text: str) -> str:
     """
     if not text:
         return ""
-    escaped = []
-    for ch in text:
-        if ch in _MARKDOWN_SPECIAL_CHARS:
-            escaped.append("\\" + ch)
-        else:
-            escaped.append(ch)
-    return "".join(escaped)
+    if len(text) < _CACHED_TEXT_CHARS:
+        return _escape_markdown_cached(text)
+    return _escape_markdown(text)
+
+
+def _escape_markdown(text: str) -> str:
+    # One C-level str.replace pass per special character is several times
+    # faster than a per-character loop (and than str.translate, which falls
+    # off its fast path when a character maps to two).
+    for ch, escaped in _MARKDOWN_ESCAPES:
+        text = text.replace(ch, escaped)
+    return text
+
+
+_escape_markdown_cached = lru_cache(maxsize=512)(_escape_markdown)
+
+
+# A line break (anything str.splitlines() splits on), the next line's
+# indentation, and one heading / quote / bullet marker. Matches are replaced
+# by a single space, which normalize_whitespace() collapses afterwards.
+_MARKDOWN_PREFIX_LINE_RE = re.compile(
+    r"[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]\s*(?:#{1,3}|>|[-*+]) "
+)
 
 
 def strip_markdown(text: str) -> str:
@@ -75,16 +114,6 @@ def strip_markdown(text: str) -> str:
     if not text:
         return ""
 
-    # Remove common Markdown prefix characters at the start of lines
-    lines = text.splitlines()
-    cleaned_lines = []
-    for line in lines:
-        stripped = line.lstrip()
-        for prefix in ("# ", "## ", "### ", "> ", "- ", "* ", "+ "):
-            if stripped.startswith(prefix):
-                stripped = stripped[len(prefix) :]
-                break
-        cleaned_lines.append(stripped)
-
-    joined = "\n".join(cleaned_lines)
-    return normalize_whitespace(joined)
\ No newline at end of file
+    # Remove common Markdown prefix characters at the start of lines in a
+    # single pass; the leading newline lets the first line match as well.
+    return normalize_whitespace(_MARKDOWN_PREFIX_LINE_RE.sub(" ", "\n" + text))
\ No newline at end of file
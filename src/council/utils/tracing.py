@@ -3,31 +3,77 @@ from __future__ import annotations
 
 import logging
 import time
-from contextlib import contextmanager
 from functools import wraps
-from typing import Any, Callable, Generator, Optional
+from typing import Any, Callable, Optional
 
 
 logger = logging.getLogger("council.tracing")
+# getLogger() always returns this same object, so bind its method once.
+_debug = logger.debug
 
+# Monotonic, high-resolution clock for durations; bound once at import.
+_now = time.perf_counter
 
-@contextmanager
-def trace_block(name: str, *, extra: Optional[dict] = None) -> Generator[None, None, None]:
+
+class _TraceBlock:
+    """
+    Context manager behind trace_block().
+
+    A plain class rather than a @contextmanager generator: there is no
+    generator to create and drive on every traced call.
+
+    Besides the formatted message, each record carries `trace_name`,
+    `trace_extra` and (on END) `trace_duration` attributes, so structured
+    handlers can use the values without parsing or repr()-ing them.
+    """
+
+    __slots__ = ("name", "extra", "start")
+
+    def __init__(self, name: str, extra: Optional[dict]) -> None:
+        self.name = name
+        self.extra = extra
+        self.start: Optional[float] = None
+
+    def __enter__(self) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        self.extra = self.extra or {}
+        self.start = _now()
+        _debug(
+            "START %s | extra=%s",
+            self.name,
+            self.extra,
+            extra={"trace_name": self.name, "trace_extra": self.extra},
+        )
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.start is None:
+            return
+        duration = _now() - self.start
+        _debug(
+            "END   %s | duration=%.3fs | extra=%s",
+            self.name,
+            duration,
+            self.extra,
+            extra={
+                "trace_name": self.name,
+                "trace_extra": self.extra,
+                "trace_duration": duration,
+            },
+        )
+
+
+def trace_block(name: str, *, extra: Optional[dict] = None) -> _TraceBlock:
     """
     Context manager that logs the start and end time of a code block.
 
     Example:
         with trace_block("run_debate", extra={"topic_id": topic.id}):
             result = orchestrator.run_debate(topic, council)
+
+    Does nothing unless the council.tracing logger is enabled for DEBUG.
     """
-    extra = extra or {}
-    start = time.time()
-    logger.debug("START %s | extra=%s", name, extra)
-    try:
-        yield
-    finally:
-        duration = time.time() - start
-        logger.debug("END   %s | duration=%.3fs | extra=%s", name, duration, extra)
+    return _TraceBlock(name, extra)
 
 
 def traced(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -44,10 +90,16 @@ def traced(name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callabl
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         trace_name = name or func.__qualname__
+        # Bound once per decorated function rather than looked up per call.
+        debug_enabled = logger.isEnabledFor
 
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            with trace_block(trace_name):
+            if not debug_enabled(logging.DEBUG):
+                return func(*args, **kwargs)
+            # Build the block directly: no trace_block() call or `extra`
+            # keyword handling per invocation.
+            with _TraceBlock(trace_name, None):
                 return func(*args, **kwargs)
 
         return wrapper
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The package is run from src/ rather than installed.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
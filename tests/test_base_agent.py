@@ -0,0 +1,125 @@
+import asyncio
+from typing import Iterable, Iterator, List, Optional
+
+import pytest
+
+import council.config.settings as settings_module
+import council.utils.memo as memo
+from council.agents.base_agent import AgentConfig, BaseAgent
+from council.config.settings import Settings, get_settings, override_settings
+from council.llm.base_client import ChatMessage, LLMClient
+
+
+class ChunkClient(LLMClient):
+    def __init__(self, chunks: List[str]) -> None:
+        self._chunks = chunks
+
+    def complete(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> str:
+        return "".join(self._chunks)
+
+    def stream(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> Iterator[str]:
+        return iter(self._chunks)
+
+
+def _agent(chunks: List[str]) -> BaseAgent:
+    return BaseAgent(
+        AgentConfig(name="Historian", role_id="historian"),
+        ChunkClient(chunks),
+        "You are a historian.",
+    )
+
+
+def test_respond_stream_passes_client_chunks_through():
+    chunks = ["a", "b", "c"]
+
+    assert list(_agent(chunks).respond_stream([])) == chunks
+
+
+class CountingClient(ChunkClient):
+    def __init__(self) -> None:
+        super().__init__([])
+        self.batches: List[int] = []
+        self.async_batches: List[int] = []
+
+    def complete(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> str:
+        return f"answer to {list(messages)[-1].content}"
+
+    def complete_batch(self, batch, **kwargs) -> List[str]:
+        batch = list(batch)
+        self.batches.append(len(batch))
+        return super().complete_batch(batch, **kwargs)
+
+    async def acomplete_batch(self, batch, **kwargs) -> List[str]:
+        batch = list(batch)
+        self.async_batches.append(len(batch))
+        return await super().acomplete_batch(batch, **kwargs)
+
+
+@pytest.fixture
+def response_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(memo, "_RESPONSE_CACHE", None)
+    monkeypatch.setattr(settings_module, "_SETTINGS_OVERRIDE", None)
+    override_settings(
+        Settings(
+            ollama_host="http://localhost:11434",
+            default_model_alias="m",
+            enable_response_cache=True,
+            response_cache_path=str(tmp_path / "cache.sqlite"),
+        )
+    )
+    yield
+    get_settings.cache_clear()
+
+
+def _question(text: str) -> List[ChatMessage]:
+    return [ChatMessage(role="user", content=text)]
+
+
+def test_respond_batch_across_serves_cached_responses(response_cache):
+    client = CountingClient()
+    historian = BaseAgent(AgentConfig(name="Historian", role_id="historian"), client, "H")
+    economist = BaseAgent(AgentConfig(name="Economist", role_id="economist"), client, "E")
+
+    assert historian.respond(_question("one")) == "answer to one"
+    answers = BaseAgent.respond_batch_across(
+        [historian, economist], [_question("one"), _question("two")]
+    )
+
+    assert answers == ["answer to one", "answer to two"]
+    assert client.batches == [1]  # only the economist's turn was sent
+
+
+def test_arespond_batch_across_uses_the_async_batch(response_cache):
+    client = CountingClient()
+    agents = [
+        BaseAgent(AgentConfig(name=name, role_id=name), client, name)
+        for name in ("a", "b", "c")
+    ]
+    conversations = [_question(agent.name) for agent in agents]
+
+    answers = asyncio.run(BaseAgent.arespond_batch_across(agents, conversations))
+
+    assert answers == ["answer to a", "answer to b", "answer to c"]
+    assert client.async_batches == [3]
+    assert client.batches == []
+    # A second round is answered from the cache.
+    assert asyncio.run(BaseAgent.arespond_batch_across(agents, conversations)) == answers
+    assert client.async_batches == [3]
@@ -0,0 +1,129 @@
+from typing import Iterable, Iterator, List, Optional
+
+from council.agents.base_agent import AgentConfig, BaseAgent
+from council.agents.council_factory import index_by_role
+from council.debate.consensus_strategies import PolicyLeadConsensusStrategy
+from council.debate.debate_topic import DebateTopic
+from council.debate.message import DebateMessage, DebateStage
+from council.llm.base_client import ChatMessage, LLMClient
+
+
+class NullClient(LLMClient):
+    def complete(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> str:
+        return ""
+
+    def stream(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> Iterator[str]:
+        return iter(())
+
+
+class BatchRecordingClient(NullClient):
+    def __init__(self) -> None:
+        self.batches: List[dict] = []
+
+    def complete(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> str:
+        return "- round=1 speaker=X: claim" if overrides else "consensus"
+
+    def complete_batch(self, batch, **kwargs) -> List[str]:
+        batch = list(batch)
+        self.batches.append({"size": len(batch), **kwargs})
+        return super().complete_batch(batch, **kwargs)
+
+
+def _council(client: Optional[LLMClient] = None) -> List[BaseAgent]:
+    client = client or NullClient()
+    return [
+        BaseAgent(AgentConfig(name=name, role_id=role_id), client, "prompt")
+        for name, role_id in (
+            ("Historian", "indian_historian"),
+            ("Policymaker", "policymaker_expert"),
+        )
+    ]
+
+
+def test_supplied_role_index_is_used_for_its_own_council():
+    council = _council()
+    index = index_by_role(council)
+    strategy = PolicyLeadConsensusStrategy(role_index=index)
+
+    assert strategy._role_index_for(council) is index
+    assert strategy._select_summarizer(council) is council[1]
+
+
+def test_supplied_role_index_is_not_used_for_another_council():
+    first, second = _council(), _council()
+    strategy = PolicyLeadConsensusStrategy(role_index=index_by_role(first))
+
+    assert strategy._select_summarizer(second) is second[1]
+    assert strategy._select_summarizer(first) is first[1]
+
+
+def _transcript(council: List[BaseAgent], rounds: int) -> List[DebateMessage]:
+    return [
+        DebateMessage(
+            speaker_id=agent.role_id,
+            speaker_name=agent.name,
+            role="assistant",
+            content=f"{agent.name} argues at length in round {round_index}.",
+            stage=DebateStage.OPENING if round_index == 1 else DebateStage.REBUTTAL,
+            round_index=round_index,
+        )
+        for round_index in range(1, rounds + 1)
+        for agent in council
+    ]
+
+
+def test_consensus_batch_digests_every_topic_in_one_batch():
+    client = BatchRecordingClient()
+    council = _council(client)
+    strategy = PolicyLeadConsensusStrategy(max_transcript_tokens=1)
+    topics = [
+        DebateTopic(id=str(i), title=f"T{i}", description="D") for i in range(3)
+    ]
+
+    results = strategy.generate_consensus_batch(
+        topics, [_transcript(council, rounds) for rounds in (3, 1, 2)], council
+    )
+
+    assert [result.text for result in results] == ["consensus"] * 3
+    assert [result.notes for result in results] == [
+        "summarizer=policymaker_expert transcript=condensed",
+        "summarizer=policymaker_expert",
+        "summarizer=policymaker_expert transcript=condensed",
+    ]
+    # One batch for the two digests, then one for the three consensus prompts.
+    assert [batch["size"] for batch in client.batches] == [2, 3]
+    assert client.batches[0]["max_completion_tokens"] == 512
+
+
+def test_transcript_under_budget_is_sent_in_full():
+    client = BatchRecordingClient()
+    council = _council(client)
+    transcript = _transcript(council, 2)
+    strategy = PolicyLeadConsensusStrategy()
+
+    text, condensed = strategy._transcript_for_prompt(transcript, council, council[1])
+
+    assert not condensed
+    assert text == strategy._format_transcript(transcript)
+    assert text.count("argues at length") == 4
+    assert text.startswith("round=1 stage=OPENING speaker=Historian\n")
+    assert "round=2 stage=REBUTTAL speaker=Policymaker\n" in text
+    assert client.batches == []
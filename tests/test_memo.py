@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+import council.config.settings as settings_module
+import council.utils.memo as memo
+from council.config.settings import Settings, get_settings, override_settings
+
+
+def _settings(**kwargs) -> Settings:
+    return Settings(ollama_host="http://localhost:11434", default_model_alias="m", **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(memo, "_RESPONSE_CACHE", None)
+    monkeypatch.setattr(settings_module, "_SETTINGS_OVERRIDE", None)
+    yield
+    get_settings.cache_clear()
+
+
+def test_response_cache_follows_settings(tmp_path):
+    override_settings(_settings(enable_response_cache=False))
+    assert memo.get_response_cache() is None
+
+    first_path = str(tmp_path / "first.sqlite")
+    override_settings(_settings(enable_response_cache=True, response_cache_path=first_path))
+    first = memo.get_response_cache()
+    first.set("key", "value")
+    assert memo.get_response_cache() is first
+
+    second_path = str(tmp_path / "second.sqlite")
+    override_settings(_settings(enable_response_cache=True, response_cache_path=second_path))
+    second = memo.get_response_cache()
+    assert second is not first
+    assert second.get("key") is None
+    assert (tmp_path / "second.sqlite").exists()
+
+
+def test_response_cache_is_created_once_across_threads(tmp_path, monkeypatch):
+    created = []
+
+    class CountingCache(memo.ResponseCache):
+        def __init__(self, *args, **kwargs) -> None:
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(memo, "ResponseCache", CountingCache)
+    override_settings(
+        _settings(
+            enable_response_cache=True,
+            response_cache_path=str(tmp_path / "cache.sqlite"),
+        )
+    )
+    start = threading.Barrier(8)
+    seen = []
+
+    def worker() -> None:
+        start.wait()
+        seen.append(memo.get_response_cache())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(cache is created[0] for cache in seen)
@@ -0,0 +1,177 @@
+import asyncio
+import gc
+import socket
+import time
+
+import pytest
+
+from council.config.settings import ModelConfig
+from council.llm.base_client import ChatMessage
+from council.llm.ollama_client import OllamaLLMClient
+
+
+def _closed_port() -> int:
+    # Bind and release a port so nothing is listening on it.
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _unreachable_client(**kwargs) -> OllamaLLMClient:
+    return OllamaLLMClient(
+        host=f"http://127.0.0.1:{_closed_port()}",
+        models={"test": ModelConfig(name="test-model")},
+        default_model_alias="test",
+        retry_backoff=0.0,
+        **kwargs,
+    )
+
+
+def _count_calls(target, attr: str) -> list:
+    calls = []
+    original = getattr(target, attr)
+
+    def counted(**payload):
+        calls.append(payload)
+        return original(**payload)
+
+    setattr(target, attr, counted)
+    return calls
+
+
+def test_complete_retries_refused_connection():
+    client = _unreachable_client(max_retries=2)
+    calls = _count_calls(client._client, "chat")
+
+    with pytest.raises(ConnectionError):
+        client.complete([ChatMessage(role="user", content="hi")])
+
+    assert len(calls) == 3
+    client.close()
+
+
+def test_acomplete_retries_refused_connection():
+    client = _unreachable_client(max_retries=2)
+
+    async def run() -> list:
+        calls = _count_calls(client._async_client(), "chat")
+        with pytest.raises(ConnectionError):
+            await client.acomplete([ChatMessage(role="user", content="hi")])
+        await client.aclose()
+        return calls
+
+    assert len(asyncio.run(run())) == 3
+    client.close()
+
+
+def test_acomplete_shares_identical_inflight_requests():
+    client = _unreachable_client()
+    calls = []
+
+    class SlowChat:
+        async def chat(self, **payload):
+            calls.append(payload)
+            await asyncio.sleep(0.05)
+            return {"message": {"content": "shared"}}
+
+    client._async_client = lambda: SlowChat()
+    messages = [ChatMessage(role="user", content="hi")]
+
+    async def run() -> list:
+        return await asyncio.gather(
+            client.acomplete(messages),
+            client.acomplete(messages),
+            client.acomplete([ChatMessage(role="user", content="other")]),
+        )
+
+    assert asyncio.run(run()) == ["shared", "shared", "shared"]
+    assert len(calls) == 2
+    client.close()
+
+
+def test_aclose_releases_the_loops_async_client():
+    client = _unreachable_client()
+
+    async def run() -> None:
+        client._async_client()
+        await client.aclose()
+
+    for _ in range(5):
+        asyncio.run(run())
+    gc.collect()
+
+    assert client._async_clients == {}
+    client.close()
+
+
+def test_async_clients_of_closed_loops_are_dropped():
+    client = _unreachable_client()
+
+    async def run() -> None:
+        client._async_client()
+
+    for _ in range(5):
+        asyncio.run(run())
+
+    assert len(client._async_clients) == 1
+    client.close()
+
+
+def _stream_from(client: OllamaLLMClient, deltas, delay: float) -> list:
+    def chat(**payload):
+        for delta in deltas:
+            time.sleep(delay)
+            yield {"message": {"content": delta}}
+
+    client._client.chat = chat
+    return list(client.stream([ChatMessage(role="user", content="hi")]))
+
+
+def test_stream_batches_fast_deltas_into_a_few_tokens():
+    client = _unreachable_client()
+    deltas = ["ab", "cd", "ef", "gh", "ij", "kl", "mn"]
+
+    chunks = _stream_from(client, deltas, delay=0.0)
+
+    assert "".join(chunks) == "".join(deltas)
+    assert chunks[0] == "ab"  # nothing to batch with yet: sent at once
+    assert max(len(chunk) for chunk in chunks) <= 12
+    assert len(chunks) < len(deltas)
+    client.close()
+
+
+def test_stream_passes_slow_deltas_straight_through():
+    client = _unreachable_client()
+    deltas = ["ab", "cd", "ef"]
+
+    assert _stream_from(client, deltas, delay=0.06) == deltas
+    client.close()
+
+
+def test_acomplete_waiters_outlive_a_cancelled_owner():
+    client = _unreachable_client()
+    calls = []
+
+    class SlowChat:
+        async def chat(self, **payload):
+            calls.append(payload)
+            await asyncio.sleep(0.05)
+            return {"message": {"content": "answer"}}
+
+    client._async_client = lambda: SlowChat()
+    messages = [ChatMessage(role="user", content="hi")]
+
+    async def run() -> str:
+        owner = asyncio.create_task(client.acomplete(messages))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(client.acomplete(messages))
+        await asyncio.sleep(0.01)
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        return await waiter
+
+    assert asyncio.run(run()) == "answer"
+    assert len(calls) == 2
+    assert client._inflight == {}
+    client.close()
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import httpx
+from ollama import Client
+
+from council.agents.base_agent import AgentConfig, BaseAgent
+from council.config.settings import ModelConfig
+from council.debate.debate_protocol import BasicDebateProtocol, RoundConfig
+from council.debate.debate_topic import DebateTopic
+from council.debate.orchestrator import DebateOrchestrator
+from council.llm.ollama_client import OllamaLLMClient
+
+_HOST = "http://ollama.test"
+
+
+def _reply(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    prompt = body["messages"][-1]["content"]
+    return httpx.Response(
+        200,
+        json={
+            "model": body["model"],
+            "message": {"role": "assistant", "content": f"reply to {len(prompt)}"},
+            "done": True,
+        },
+    )
+
+
+class SlowPool(httpx.AsyncBaseTransport):
+    """
+    Answers after a short delay; like a real connection pool, closing it
+    fails the requests still waiting on it.
+    """
+
+    def __init__(self) -> None:
+        self._generation = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        generation = self._generation
+        await asyncio.sleep(0.01)
+        if generation != self._generation:
+            raise httpx.ReadError("connection closed", request=request)
+        return _reply(request)
+
+    async def aclose(self) -> None:
+        self._generation += 1
+
+
+def _mocked_client() -> OllamaLLMClient:
+    client = OllamaLLMClient(
+        host=_HOST,
+        models={"test": ModelConfig(name="test-model")},
+        default_model_alias="test",
+        max_retries=0,
+    )
+    client._http_options["transport"] = SlowPool()
+    client._client = Client(host=_HOST, transport=httpx.MockTransport(_reply))
+    return client
+
+
+def _council(client: OllamaLLMClient):
+    return [
+        BaseAgent(AgentConfig(name=name, role_id=role_id), client, f"You are {name}.")
+        for name, role_id in (
+            ("Historian", "indian_historian"),
+            ("Policymaker", "policymaker_expert"),
+        )
+    ]
+
+
+def test_concurrent_debates_on_one_loop_share_the_client():
+    client = _mocked_client()
+    council = _council(client)
+    short = DebateOrchestrator(BasicDebateProtocol(RoundConfig(num_rebuttal_rounds=0)))
+    long = DebateOrchestrator(BasicDebateProtocol(RoundConfig(num_rebuttal_rounds=3)))
+
+    async def run():
+        return await asyncio.gather(
+            short.arun_debate(DebateTopic(id="a", title="A", description="A"), council),
+            long.arun_debate(DebateTopic(id="b", title="B", description="B"), council),
+        )
+
+    first, second = asyncio.run(run())
+
+    assert len(first.transcript.messages) == 2
+    assert len(second.transcript.messages) == 8
+    client.close()
+
+
+def test_run_debate_releases_the_loops_async_client():
+    client = _mocked_client()
+    orchestrator = DebateOrchestrator(BasicDebateProtocol())
+
+    orchestrator.run_debate(DebateTopic(id="a", title="A", description="A"), _council(client))
+
+    assert client._async_clients == {}
+    client.close()
+
+
+def test_concurrent_rebuttals_are_awaited_as_async_batches():
+    client = _mocked_client()
+    blocking = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        blocking.append(json.loads(request.content)["messages"][-1]["content"])
+        return _reply(request)
+
+    client._client = Client(host=_HOST, transport=httpx.MockTransport(record))
+    orchestrator = DebateOrchestrator(
+        BasicDebateProtocol(RoundConfig(num_rebuttal_rounds=2, concurrent_rebuttals=True))
+    )
+
+    result = orchestrator.run_debate(
+        DebateTopic(id="a", title="A", description="A"), _council(client)
+    )
+
+    assert len(result.transcript.messages) == 6
+    # Only the consensus goes through the blocking client.
+    assert len(blocking) == 1
+    assert "COUNCIL CONSENSUS" in blocking[0]
+    client.close()
@@ -0,0 +1,38 @@
+import asyncio
+import json
+
+import council.io.persistence as persistence
+from council.debate.debate_topic import DebateTopic
+from council.debate.message import DebateMessage, DebateStage
+from council.debate.orchestrator import DebateResult, DebateTranscript
+
+
+def _result(topic: DebateTopic, content: str) -> DebateResult:
+    transcript = DebateTranscript(topic=topic)
+    transcript.messages.append(
+        DebateMessage(
+            speaker_id="historian",
+            speaker_name="Historian",
+            role="assistant",
+            content=content,
+            stage=DebateStage.OPENING,
+            round_index=0,
+        )
+    )
+    return DebateResult(transcript=transcript, consensus=None)
+
+
+def test_concurrent_saves_of_one_topic_keep_every_debate(tmp_path, monkeypatch):
+    monkeypatch.setattr(persistence, "_debates_dir", lambda: tmp_path)
+    topic = DebateTopic(id="same topic", title="T", description="D")
+    results = [_result(topic, f"debate {i}") for i in range(5)]
+
+    paths = asyncio.run(persistence.asave_debate_results(results))
+
+    assert len(set(paths)) == len(results)
+    assert sorted(tmp_path.iterdir()) == sorted(paths)
+    contents = [
+        json.loads(path.read_text(encoding="utf-8"))["messages"][0]["content"]
+        for path in paths
+    ]
+    assert contents == [f"debate {i}" for i in range(5)]
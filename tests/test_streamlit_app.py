@@ -0,0 +1,60 @@
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import council.io.persistence as persistence
+import council.llm.model_registry as model_registry
+from council.llm.base_client import ChatMessage, LLMClient
+
+APP = Path(__file__).resolve().parents[1] / "src" / "council" / "io" / "streamlit_app.py"
+
+
+class CannedClient(LLMClient):
+    def complete(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> str:
+        return "".join(self.stream(messages))
+
+    def stream(
+        self,
+        messages: Iterable[ChatMessage],
+        *,
+        model_alias: Optional[str] = None,
+        **overrides,
+    ) -> Iterator[str]:
+        yield from ("Sources ", "are ", "uneven.")
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_registry, "_LLM_CLIENT", CannedClient())
+    monkeypatch.setattr(persistence, "_debates_dir", lambda: tmp_path)
+    at = AppTest.from_file(str(APP), default_timeout=60)
+    at.run()
+    return at
+
+
+def test_timeline_card_cache_survives_reruns(app):
+    app.text_area[0].input("Should land records be digitised?")
+    app.slider[0].set_value(1)
+    app.run()
+    app.button[0].click()
+    app.run()
+    assert not app.exception
+
+    messages = app.session_state["latest_result"].transcript.messages
+    cache = app.session_state["timeline_cards"]
+    assert cache[0] is messages
+
+    app.run()
+    app.radio[0].set_value("Rebuttals only")
+    app.run()
+
+    assert not app.exception
+    assert app.session_state["timeline_cards"] is cache